@@ -3,26 +3,43 @@ Builder Pattern Implementation
 
 This module provides a complete implementation of the Builder Pattern
 for meal preparation.
+
+The public classes are imported lazily on first access (PEP 562), so
+importing the package does not load every builder module up front.
 """
 
-from .meal import Meal, MealItem
-from .meal_builder import MealBuilder
-from .concrete_builders import (
-    RegularMealBuilder,
-    VegetarianMealBuilder,
-    ChildrenMealBuilder,
-)
-from .meal_director import MealDirector, MealConfig
-from .fluent_builder import FluentMealBuilder
-
-__all__ = [
-    "Meal",
-    "MealItem",
-    "MealBuilder",
-    "RegularMealBuilder",
-    "VegetarianMealBuilder",
-    "ChildrenMealBuilder",
-    "MealDirector",
-    "MealConfig",
-    "FluentMealBuilder",
-]
+from importlib import import_module
+from typing import Any, Dict, List
+
+# Maps each public name to the submodule that defines it
+_EXPORTS: Dict[str, str] = {
+    "Meal": "meal",
+    "MealItem": "meal",
+    "MealBuilder": "meal_builder",
+    "RegularMealBuilder": "concrete_builders",
+    "VegetarianMealBuilder": "concrete_builders",
+    "ChildrenMealBuilder": "concrete_builders",
+    "MealDirector": "meal_director",
+    "MealConfig": "meal_director",
+    "FluentMealBuilder": "fluent_builder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public class from its submodule on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache the value so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,10 @@
 """Module for building computers using the builder pattern."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Dict, FrozenSet, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Computer:
     """Represents a computer with various components."""
 
@@ -19,55 +19,67 @@ class Computer:
 class ComputerBuilder:
     """Builder class for creating Computer instances."""
 
+    __slots__ = ("_components",)
+
+    _COMPONENTS: ClassVar[FrozenSet[str]] = frozenset(
+        {"case", "cpu", "memory", "storage", "gpu", "power_supply"}
+    )
+
     def __init__(self) -> None:
         """Initialize an empty computer builder."""
-        self._case: Optional[str] = None
-        self._cpu: Optional[str] = None
-        self._memory: Optional[str] = None
-        self._storage: Optional[str] = None
-        self._gpu: Optional[str] = None
-        self._power_supply: Optional[str] = None
+        self._components: Dict[str, Optional[str]] = dict.fromkeys(
+            ("case", "cpu", "memory", "storage", "gpu", "power_supply")
+        )
 
     def with_case(self, case: str) -> "ComputerBuilder":
         """Set the computer case."""
-        self._case = case
+        self._components["case"] = case
         return self
 
     def with_cpu(self, cpu: str) -> "ComputerBuilder":
         """Set the CPU."""
-        self._cpu = cpu
+        self._components["cpu"] = cpu
         return self
 
     def with_memory(self, memory: str) -> "ComputerBuilder":
         """Set the memory."""
-        self._memory = memory
+        self._components["memory"] = memory
         return self
 
     def with_storage(self, storage: str) -> "ComputerBuilder":
         """Set the storage."""
-        self._storage = storage
+        self._components["storage"] = storage
         return self
 
     def with_gpu(self, gpu: str) -> "ComputerBuilder":
         """Set the GPU."""
-        self._gpu = gpu
+        self._components["gpu"] = gpu
         return self
 
     def with_power_supply(self, power_supply: str) -> "ComputerBuilder":
         """Set the power supply."""
-        self._power_supply = power_supply
+        self._components["power_supply"] = power_supply
+        return self
+
+    def with_components(self, **components: str) -> "ComputerBuilder":
+        """Set several components at once.
+
+        Args:
+            **components: Component values keyed by name (e.g. ``cpu="Intel i9"``)
+
+        Raises:
+            ValueError: If an unknown component name is given
+        """
+        unknown = components.keys() - self._COMPONENTS
+        if unknown:
+            names = ", ".join(sorted(unknown))
+            raise ValueError(f"Unknown computer components: {names}")
+        self._components.update(components)
         return self
 
     def build(self) -> Computer:
         """Build and return the computer."""
-        if not self._case:
+        if not self._components["case"]:
             raise ValueError("Computer case is required")
 
-        return Computer(
-            case=self._case,
-            cpu=self._cpu,
-            memory=self._memory,
-            storage=self._storage,
-            gpu=self._gpu,
-            power_supply=self._power_supply,
-        )
+        return Computer(**self._components)
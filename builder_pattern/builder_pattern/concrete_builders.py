@@ -7,23 +7,14 @@ from .meal import MealItem
 class RegularMealBuilder(MealBuilder):
     """Builder for regular meals."""
 
-    def add_main_dish(self) -> None:
-        """Add a burger as the main dish."""
-        self._meal.main_dish = MealItem.BURGER
-        self._meal.contains_allergens.append("Gluten")
+    __slots__ = ()
 
-    def add_side_dish(self) -> None:
-        """Add fries as the side dish."""
-        self._meal.side_dish = MealItem.FRIES
-
-    def add_drink(self) -> None:
-        """Add a soft drink."""
-        self._meal.drink = MealItem.SOFT_DRINK
-
-    def add_dessert(self) -> None:
-        """Add ice cream as dessert."""
-        self._meal.dessert = MealItem.ICE_CREAM
-        self._meal.contains_allergens.append("Dairy")
+    SPEC = {
+        "main_dish": (MealItem.BURGER, ("Gluten",)),
+        "side_dish": (MealItem.FRIES, ()),
+        "drink": (MealItem.SOFT_DRINK, ()),
+        "dessert": (MealItem.ICE_CREAM, ("Dairy",)),
+    }
 
     def add_nutrition_info(self) -> None:
         """Add nutrition information."""
@@ -35,26 +26,16 @@ class RegularMealBuilder(MealBuilder):
 class VegetarianMealBuilder(MealBuilder):
     """Builder for vegetarian meals."""
 
-    def _initialize_meal(self) -> None:
-        """Initialize vegetarian meal properties."""
-        self._meal.is_vegetarian = True
-
-    def add_main_dish(self) -> None:
-        """Add pasta as the main dish."""
-        self._meal.main_dish = MealItem.PASTA
-        self._meal.contains_allergens.append("Gluten")
+    __slots__ = ()
 
-    def add_side_dish(self) -> None:
-        """Add salad as the side dish."""
-        self._meal.side_dish = MealItem.SALAD
+    _PRESETS = {"is_vegetarian": True}
 
-    def add_drink(self) -> None:
-        """Add juice as the drink."""
-        self._meal.drink = MealItem.JUICE
-
-    def add_dessert(self) -> None:
-        """Add fruit as dessert."""
-        self._meal.dessert = MealItem.FRUIT
+    SPEC = {
+        "main_dish": (MealItem.PASTA, ("Gluten",)),
+        "side_dish": (MealItem.SALAD, ()),
+        "drink": (MealItem.JUICE, ()),
+        "dessert": (MealItem.FRUIT, ()),
+    }
 
     def add_extras(self) -> None:
         """Add extra veggies."""
@@ -64,26 +45,16 @@ class VegetarianMealBuilder(MealBuilder):
 class ChildrenMealBuilder(MealBuilder):
     """Builder for children's meals."""
 
-    def _initialize_meal(self) -> None:
-        """Initialize children's meal properties."""
-        self._meal.is_kids_meal = True
-
-    def add_main_dish(self) -> None:
-        """Add chicken as the main dish."""
-        self._meal.main_dish = MealItem.CHICKEN
-
-    def add_side_dish(self) -> None:
-        """Add fries as the side dish."""
-        self._meal.side_dish = MealItem.FRIES
+    __slots__ = ()
 
-    def add_drink(self) -> None:
-        """Add juice as the drink."""
-        self._meal.drink = MealItem.JUICE
+    _PRESETS = {"is_kids_meal": True}
 
-    def add_dessert(self) -> None:
-        """Add ice cream as dessert."""
-        self._meal.dessert = MealItem.ICE_CREAM
-        self._meal.contains_allergens.append("Dairy")
+    SPEC = {
+        "main_dish": (MealItem.CHICKEN, ()),
+        "side_dish": (MealItem.FRIES, ()),
+        "drink": (MealItem.JUICE, ()),
+        "dessert": (MealItem.ICE_CREAM, ("Dairy",)),
+    }
 
     def add_extras(self) -> None:
         """Add a toy."""
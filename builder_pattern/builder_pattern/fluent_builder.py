@@ -1,9 +1,47 @@
-from copy import deepcopy
-from typing import Dict, List, Any
+import sys
+from dataclasses import fields, replace
+from typing import Dict, Any, FrozenSet, Mapping, Sequence, Tuple
 
 from .meal import Meal, MealItem
 
 
+def _interned(
+    table: Dict[MealItem, Tuple[str, ...]],
+) -> Dict[MealItem, Tuple[str, ...]]:
+    """Intern the allergen names of a table once, when the module loads."""
+    return {item: tuple(map(sys.intern, names)) for item, names in table.items()}
+
+
+# Allergens implied by each main dish and dessert
+_MAIN_DISH_ALLERGENS = _interned(
+    {
+        MealItem.BURGER: ("Gluten",),
+        MealItem.SANDWICH: ("Gluten",),
+        MealItem.FISH: ("Fish",),
+        MealItem.PASTA: ("Gluten",),
+    }
+)
+
+_DESSERT_ALLERGENS = _interned(
+    {
+        MealItem.ICE_CREAM: ("Dairy",),
+        MealItem.CAKE: ("Dairy", "Gluten"),
+    }
+)
+
+# Keys accepted by FluentMealBuilder.from_spec()
+_MEAL_FIELDS: FrozenSet[str] = frozenset(field.name for field in fields(Meal))
+
+# Meal fields holding a single MealItem, converted by from_spec()
+_COURSE_FIELDS: Tuple[str, ...] = (
+    "main_dish",
+    "side_dish",
+    "drink",
+    "dessert",
+    "appetizer",
+)
+
+
 class FluentMealBuilder:
     """
     A fluent builder for creating meals using method chaining.
@@ -11,11 +49,15 @@ class FluentMealBuilder:
     a fluent interface (method chaining) instead of separate steps.
     """
 
+    __slots__ = ("_meal", "_allergens")
+
     def __init__(self) -> None:
         """
         Initialize the builder with an empty meal.
         """
         self._meal = Meal(name="Custom Meal")
+        # Insertion-ordered set of allergens, copied onto the meal on build
+        self._allergens: Dict[str, None] = {}
 
     def with_name(self, name: str) -> "FluentMealBuilder":
         """
@@ -69,14 +111,8 @@ class FluentMealBuilder:
         self._meal.main_dish = dish
 
         # Add appropriate allergens based on the dish
-        if dish in (MealItem.BURGER, MealItem.SANDWICH):
-            self._append_allergen("Gluten")
-
-        if dish == MealItem.FISH:
-            self._append_allergen("Fish")
-
-        if dish == MealItem.PASTA:
-            self._append_allergen("Gluten")
+        for allergen in _MAIN_DISH_ALLERGENS.get(dish, ()):
+            self._append_allergen(allergen)
 
         return self
 
@@ -119,11 +155,8 @@ class FluentMealBuilder:
         self._meal.dessert = dessert
 
         # Add appropriate allergens based on the dessert
-        if dessert in (MealItem.ICE_CREAM, MealItem.CAKE):
-            self._append_allergen("Dairy")
-
-        if dessert == MealItem.CAKE:
-            self._append_allergen("Gluten")
+        for allergen in _DESSERT_ALLERGENS.get(dessert, ()):
+            self._append_allergen(allergen)
 
         return self
 
@@ -140,7 +173,7 @@ class FluentMealBuilder:
         self._meal.appetizer = appetizer
         return self
 
-    def with_extras(self, extras: List[MealItem]) -> "FluentMealBuilder":
+    def with_extras(self, extras: Sequence[MealItem]) -> "FluentMealBuilder":
         """
         Add extras to the meal.
 
@@ -150,7 +183,7 @@ class FluentMealBuilder:
         Returns:
             FluentMealBuilder: The builder instance for method chaining
         """
-        self._meal.extras = extras
+        self._meal.extras = tuple(extras)
         return self
 
     def with_nutrition_info(self, info: Dict[str, Any]) -> "FluentMealBuilder":
@@ -163,20 +196,23 @@ class FluentMealBuilder:
         Returns:
             FluentMealBuilder: The builder instance for method chaining
         """
-        self._meal.nutrition_info = info
+        self._meal.nutrition_info = dict(info)
         return self
 
     def with_allergen(self, allergen: str) -> "FluentMealBuilder":
         """
         Add an allergen to the meal.
 
+        The name is interned so every meal naming the same allergen shares a
+        single string object, including names built at runtime.
+
         Args:
             allergen: The allergen to add
 
         Returns:
             FluentMealBuilder: The builder instance for method chaining
         """
-        self._append_allergen(allergen)
+        self._append_allergen(sys.intern(allergen))
         return self
 
     def vegetarian(self) -> "FluentMealBuilder":
@@ -201,20 +237,91 @@ class FluentMealBuilder:
 
     def _append_allergen(self, allergen: str) -> None:
         """
-        Helper method to append an allergen to the meal if it's not already included.
+        Helper method to record an allergen for the meal if it's not already included.
 
         Args:
-            allergen: The allergen to append
+            allergen: The allergen to append, already interned by the caller
         """
-        if allergen not in self._meal.contains_allergens:
-            self._meal.contains_allergens.append(allergen)
+        self._allergens[allergen] = None
 
     def build(self) -> Meal:
         """
         Build and return the final meal.
 
+        The built meal is handed over to the caller and the builder starts
+        over with a fresh meal, so no copy of the product is needed.
+
         Returns:
             Meal: The constructed meal
         """
-        # Return a deep copy to ensure builder is decoupled from the product
-        return deepcopy(self._meal)
+        meal, self._meal = self._meal, Meal(name="Custom Meal")
+        meal.contains_allergens = list(self._allergens)
+        self._allergens = {}
+        return meal
+
+    def build_copy(self) -> Meal:
+        """
+        Build a copy of the meal, leaving the builder's state untouched.
+
+        Only the mutable containers are copied, which is all that is needed
+        to keep the builder decoupled from the returned product.
+
+        Returns:
+            Meal: A copy of the meal built so far
+        """
+        meal = self._meal
+        return replace(
+            meal,
+            contains_allergens=list(self._allergens),
+            nutrition_info=dict(meal.nutrition_info),
+        )
+
+    @classmethod
+    def from_spec(cls, spec: Mapping[str, Any]) -> Meal:
+        """
+        Build a meal from a mapping of meal fields in a single call.
+
+        This is the bulk counterpart of the chained ``with_*`` calls, meant
+        for loading many meals at once (e.g. from JSON). The keys are the
+        ``Meal`` field names. Courses and extras may be given as ``MealItem``
+        members or their display names (e.g. ``"Burger"``); allergens implied
+        by the main dish and dessert are added just as
+        ``with_main_dish``/``with_dessert`` would.
+
+        Args:
+            spec: The meal fields to set
+
+        Returns:
+            Meal: The constructed meal
+
+        Raises:
+            ValueError: If the spec contains keys that are not meal fields, or
+                a course or extra that is not a ``MealItem``
+        """
+        unknown = spec.keys() - _MEAL_FIELDS
+        if unknown:
+            names = ", ".join(sorted(unknown))
+            raise ValueError(f"Unknown meal fields: {names}")
+
+        courses = {
+            name: MealItem(spec[name])
+            for name in _COURSE_FIELDS
+            if spec.get(name) is not None
+        }
+        allergens: Dict[str, None] = dict.fromkeys(
+            (
+                *_MAIN_DISH_ALLERGENS.get(courses.get("main_dish"), ()),
+                *_DESSERT_ALLERGENS.get(courses.get("dessert"), ()),
+                *map(sys.intern, spec.get("contains_allergens") or ()),
+            )
+        )
+        return Meal(
+            **{
+                **spec,
+                **courses,
+                "name": spec.get("name", "Custom Meal"),
+                "extras": tuple(map(MealItem, spec.get("extras") or ())),
+                "contains_allergens": list(allergens),
+                "nutrition_info": dict(spec.get("nutrition_info") or {}),
+            }
+        )
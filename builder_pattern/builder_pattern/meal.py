@@ -1,32 +1,51 @@
 """Module containing the Meal and MealItem classes."""
 
-from enum import Enum, auto
-from typing import List, Optional, Dict, Any
+from enum import Enum
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 
 
-class MealItem(Enum):
-    """Enumeration of meal components."""
-
-    BURGER = auto()
-    CHICKEN = auto()
-    FISH = auto()
-    PASTA = auto()
-    SANDWICH = auto()
-    FRIES = auto()
-    SALAD = auto()
-    RICE = auto()
-    SOFT_DRINK = auto()
-    JUICE = auto()
-    WATER = auto()
-    ICE_CREAM = auto()
-    CAKE = auto()
-    FRUIT = auto()
-    SOUP = auto()
-    TOY = auto()
-
-
-@dataclass
+class MealItem(str, Enum):
+    """Enumeration of meal components, valued by their display names."""
+
+    BURGER = "Burger"
+    CHICKEN = "Chicken"
+    FISH = "Fish"
+    PASTA = "Pasta"
+    SANDWICH = "Sandwich"
+    FRIES = "Fries"
+    SALAD = "Salad"
+    RICE = "Rice"
+    SOFT_DRINK = "Soft Drink"
+    JUICE = "Juice"
+    WATER = "Water"
+    ICE_CREAM = "Ice Cream"
+    CAKE = "Cake"
+    FRUIT = "Fruit"
+    SOUP = "Soup"
+    TOY = "Toy"
+
+
+# Formats one "key: value" pair of the nutrition info
+_KEY_VALUE_FORMAT = "{}: {}".format
+
+# Courses shown by Meal.display(), in display order, with their labels
+_COURSE_LABELS: Tuple[Tuple[str, str], ...] = (
+    ("main_dish", "Main"),
+    ("side_dish", "Side"),
+    ("appetizer", "Appetizer"),
+    ("drink", "Drink"),
+    ("dessert", "Dessert"),
+)
+
+# Boolean flags shown by Meal.display() and the line each one adds when set
+_FLAG_LINES: Tuple[Tuple[str, str], ...] = (
+    ("is_vegetarian", "Vegetarian: Yes"),
+    ("is_kids_meal", "Kids Meal: Yes"),
+)
+
+
+@dataclass(slots=True)
 class Meal:
     """Class representing a meal with various components."""
 
@@ -38,7 +57,7 @@ class Meal:
     drink: Optional[MealItem] = None
     dessert: Optional[MealItem] = None
     appetizer: Optional[MealItem] = None
-    extras: List[MealItem] = field(default_factory=list)
+    extras: Sequence[MealItem] = ()
     contains_allergens: List[str] = field(default_factory=list)
     nutrition_info: Dict[str, Any] = field(default_factory=dict)
     is_vegetarian: bool = False
@@ -52,43 +71,28 @@ class Meal:
             lines.append(f"=== {self.name} ===")
 
         if self.description:
-            lines.append(f"{self.description}")
+            lines.append(self.description)
 
         if self.price is not None:
             lines.append(f"Price: ${self.price:.2f}")
 
-        if self.main_dish:
-            lines.append(f"Main: {self.main_dish.name.title().replace('_', ' ')}")
-
-        if self.side_dish:
-            lines.append(f"Side: {self.side_dish.name.title().replace('_', ' ')}")
-
-        if self.appetizer:
-            lines.append(f"Appetizer: {self.appetizer.name.title().replace('_', ' ')}")
-
-        if self.drink:
-            lines.append(f"Drink: {self.drink.name.title().replace('_', ' ')}")
-
-        if self.dessert:
-            lines.append(f"Dessert: {self.dessert.name.title().replace('_', ' ')}")
+        for attr, label in _COURSE_LABELS:
+            item = getattr(self, attr)
+            if item:
+                lines.append(f"{label}: {item.value}")
 
         if self.extras:
-            extras_list = ", ".join(
-                [item.name.title().replace("_", " ") for item in self.extras]
-            )
+            extras_list = ", ".join(self.extras)
             lines.append(f"Extras: {extras_list}")
 
         if self.nutrition_info:
-            nutrition_str = ", ".join(
-                [f"{k}: {v}" for k, v in self.nutrition_info.items()]
-            )
+            info = self.nutrition_info
+            nutrition_str = ", ".join(map(_KEY_VALUE_FORMAT, info, info.values()))
             lines.append(f"Nutrition: {nutrition_str}")
 
-        if self.is_vegetarian:
-            lines.append("Vegetarian: Yes")
-
-        if self.is_kids_meal:
-            lines.append("Kids Meal: Yes")
+        for attr, line in _FLAG_LINES:
+            if getattr(self, attr):
+                lines.append(line)
 
         if self.contains_allergens:
             allergens = ", ".join(self.contains_allergens)
@@ -98,16 +102,11 @@ class Meal:
 
     def total_items(self) -> int:
         """Count the total number of items in the meal."""
-        count = 0
-        if self.main_dish:
-            count += 1
-        if self.side_dish:
-            count += 1
-        if self.appetizer:
-            count += 1
-        if self.drink:
-            count += 1
-        if self.dessert:
-            count += 1
-        count += len(self.extras)
-        return count
+        return (
+            (self.main_dish is not None)
+            + (self.side_dish is not None)
+            + (self.appetizer is not None)
+            + (self.drink is not None)
+            + (self.dessert is not None)
+            + len(self.extras)
+        )
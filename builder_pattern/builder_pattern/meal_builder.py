@@ -1,12 +1,46 @@
 """Module containing the abstract MealBuilder class."""
 
 from abc import ABC, abstractmethod
+from typing import Any, Callable, ClassVar, Dict, Tuple
+
 from .meal import Meal, MealItem
 
 
+def _spec_step(step: str) -> Callable[["MealBuilder"], None]:
+    """Create an ``add_<step>`` method that applies the builder's SPEC entry."""
+
+    def add_step(self: "MealBuilder") -> None:
+        self.apply_spec(step)
+
+    add_step.__name__ = f"add_{step}"
+    add_step.__doc__ = f"Add the {step.replace('_', ' ')} listed in the builder's SPEC."
+    return add_step
+
+
 class MealBuilder(ABC):
     """Abstract base class for meal builders."""
 
+    __slots__ = ("_meal",)
+
+    # Meal fields every new meal starts with; concrete builders override it
+    # to preset their own flags.
+    _PRESETS: ClassVar[Dict[str, Any]] = {}
+
+    # Maps a meal field (e.g. "main_dish") to the item to put there and the
+    # allergens it brings. Concrete builders fill this in and get matching
+    # add_<field>() methods generated for them.
+    SPEC: ClassVar[Dict[str, Tuple[MealItem, Tuple[str, ...]]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Generate add_<field>() methods for the SPEC entries of a subclass."""
+        super().__init_subclass__(**kwargs)
+        for step in cls.__dict__.get("SPEC", {}):
+            name = f"add_{step}"
+            if name not in cls.__dict__:
+                add_step = _spec_step(step)
+                add_step.__qualname__ = f"{cls.__qualname__}.{name}"
+                setattr(cls, name, add_step)
+
     def __init__(self):
         """Initialize the builder with a reset."""
         self._meal = None
@@ -14,7 +48,8 @@ class MealBuilder(ABC):
 
     def reset(self) -> None:
         """Reset the builder to create a new meal."""
-        self._meal = Meal(name="")
+        # extras is a list while building; get_meal() freezes it to a tuple
+        self._meal = Meal(name="", extras=[], **self._PRESETS)
         self._initialize_meal()
 
     def _initialize_meal(self) -> None:
@@ -29,6 +64,8 @@ class MealBuilder(ABC):
     def get_meal(self) -> Meal:
         """Get the built meal and reset the builder."""
         meal = self.meal
+        # The extras list is only appended to while building
+        meal.extras = tuple(meal.extras)
         self.reset()
         return meal
 
@@ -44,6 +81,12 @@ class MealBuilder(ABC):
         """Set the meal price."""
         self._meal.price = price
 
+    def apply_spec(self, step: str) -> None:
+        """Add the item configured for a meal field in SPEC, with its allergens."""
+        item, allergens = self.SPEC[step]
+        setattr(self._meal, step, item)
+        self._meal.contains_allergens.extend(allergens)
+
     @abstractmethod
     def add_main_dish(self) -> None:
         """Add the main dish to the meal."""
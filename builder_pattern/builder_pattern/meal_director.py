@@ -1,12 +1,13 @@
 """Module containing the MealDirector and MealConfig classes."""
 
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
 from .meal_builder import MealBuilder
 from .meal import Meal
 
 
-@dataclass
+@dataclass(slots=True)
 class MealConfig:
     """Configuration for meal construction."""
 
@@ -22,6 +23,20 @@ class MealConfig:
     nutrition_info: bool = False
 
 
+_NO_BUILDER_MESSAGE = "No builder set. Call set_builder() first."
+
+# Optional MealConfig steps, in build order, and the builder method for each
+_STEP_METHODS: Tuple[Tuple[str, str], ...] = (
+    ("main_dish", "add_main_dish"),
+    ("side_dish", "add_side_dish"),
+    ("drink", "add_drink"),
+    ("dessert", "add_dessert"),
+    ("appetizer", "add_appetizer"),
+    ("extras", "add_extras"),
+    ("nutrition_info", "add_nutrition_info"),
+)
+
+
 class MealDirector:
     """Director class that constructs meals using a builder."""
 
@@ -33,33 +48,34 @@ class MealDirector:
         """Set the builder to use."""
         self._builder = builder
 
-    def _check_builder(self) -> None:
-        """Check if a builder is set."""
-        if not self._builder:
-            raise ValueError("No builder set. Call set_builder() first.")
-
     def construct_basic_meal(
         self, name: str = "Basic Meal", price: float = 8.99
     ) -> Meal:
         """Construct a basic meal with just main dish and drink."""
-        self._check_builder()
-        self._builder.reset()
-        self._builder.set_name(name)
-        self._builder.set_price(price)
-        self._builder.add_main_dish()
-        self._builder.add_drink()
-        return self._builder.get_meal()
-
-    def construct_standard_meal(self) -> Meal:
+        builder = self._builder
+        if builder is None:
+            raise ValueError(_NO_BUILDER_MESSAGE)
+        builder.reset()
+        builder.set_name(name)
+        builder.set_price(price)
+        builder.add_main_dish()
+        builder.add_drink()
+        return builder.get_meal()
+
+    def construct_standard_meal(
+        self, name: str = "Standard Meal", price: float = 12.99
+    ) -> Meal:
         """Construct a standard meal with main dish, side dish, and drink."""
-        self._check_builder()
-        self._builder.reset()
-        self._builder.set_name("Standard Meal")
-        self._builder.set_price(12.99)
-        self._builder.add_main_dish()
-        self._builder.add_side_dish()
-        self._builder.add_drink()
-        return self._builder.get_meal()
+        builder = self._builder
+        if builder is None:
+            raise ValueError(_NO_BUILDER_MESSAGE)
+        builder.reset()
+        builder.set_name(name)
+        builder.set_price(price)
+        builder.add_main_dish()
+        builder.add_side_dish()
+        builder.add_drink()
+        return builder.get_meal()
 
     def construct_premium_meal(
         self,
@@ -68,58 +84,56 @@ class MealDirector:
         description: str = "A complete premium meal",
     ) -> Meal:
         """Construct a premium meal with all components."""
-        self._check_builder()
-        self._builder.reset()
-        self._builder.set_name(name)
-        self._builder.set_price(price)
-        self._builder.set_description(description)
-        self._builder.add_appetizer()
-        self._builder.add_main_dish()
-        self._builder.add_side_dish()
-        self._builder.add_drink()
-        self._builder.add_dessert()
-        self._builder.add_extras()
-        self._builder.add_nutrition_info()
-        return self._builder.get_meal()
+        builder = self._builder
+        if builder is None:
+            raise ValueError(_NO_BUILDER_MESSAGE)
+        builder.reset()
+        builder.set_name(name)
+        builder.set_price(price)
+        builder.set_description(description)
+        builder.add_appetizer()
+        builder.add_main_dish()
+        builder.add_side_dish()
+        builder.add_drink()
+        builder.add_dessert()
+        builder.add_extras()
+        builder.add_nutrition_info()
+        return builder.get_meal()
 
     def construct_custom_meal(self, config: MealConfig) -> Meal:
         """Construct a custom meal based on configuration."""
-        self._check_builder()
-        self._builder.reset()
-        self._builder.set_name(config.name)
-        self._builder.set_price(config.price)
-
-        if config.description:
-            self._builder.set_description(config.description)
-        if config.main_dish:
-            self._builder.add_main_dish()
-        if config.side_dish:
-            self._builder.add_side_dish()
-        if config.drink:
-            self._builder.add_drink()
-        if config.dessert:
-            self._builder.add_dessert()
-        if config.appetizer:
-            self._builder.add_appetizer()
-        if config.extras:
-            self._builder.add_extras()
-        if config.nutrition_info:
-            self._builder.add_nutrition_info()
-
-        return self._builder.get_meal()
+        return self._construct_configured_meal(
+            config.name, config.price, config.description, partial(getattr, config)
+        )
 
     def construct_meal_from_dict(self, config: Dict[str, Any]) -> Meal:
         """Construct a meal from a dictionary configuration."""
-        meal_config = MealConfig(
-            name=config.get("name", "Custom Meal"),
-            price=config.get("price", 10.99),
-            description=config.get("description"),
-            main_dish=config.get("main_dish", False),
-            side_dish=config.get("side_dish", False),
-            drink=config.get("drink", False),
-            dessert=config.get("dessert", False),
-            appetizer=config.get("appetizer", False),
-            extras=config.get("extras", False),
-            nutrition_info=config.get("nutrition_info", False),
+        return self._construct_configured_meal(
+            config.get("name", "Custom Meal"),
+            config.get("price", 10.99),
+            config.get("description"),
+            config.get,
         )
-        return self.construct_custom_meal(meal_config)
+
+    def _construct_configured_meal(
+        self,
+        name: str,
+        price: float,
+        description: Optional[str],
+        is_enabled: Callable[[str], Any],
+    ) -> Meal:
+        """Construct a meal, adding each optional step is_enabled() reports as set."""
+        builder = self._builder
+        if builder is None:
+            raise ValueError(_NO_BUILDER_MESSAGE)
+        builder.reset()
+        builder.set_name(name)
+        builder.set_price(price)
+
+        if description:
+            builder.set_description(description)
+        for key, method in _STEP_METHODS:
+            if is_enabled(key):
+                getattr(builder, method)()
+
+        return builder.get_meal()
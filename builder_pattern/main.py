@@ -12,7 +12,6 @@ from builder_pattern.concrete_builders import (
 )
 from builder_pattern.meal_director import MealDirector, MealConfig
 from builder_pattern.fluent_builder import FluentMealBuilder
-from builder_pattern.meal_builder import MealBuilder
 
 
 def demonstrate_classic_builder():
@@ -126,49 +125,8 @@ def demonstrate_fluent_builder():
 
 def main() -> None:
     """Run the meal builder demo."""
-    print("=== Meal Builder Demo ===\n")
-
-    # Create a builder
-    builder = MealBuilder()
-
-    # Build a breakfast meal
-    breakfast = (
-        builder.reset()
-        .add_main("Eggs Benedict")
-        .add_side("Hash Browns")
-        .add_drink("Orange Juice")
-        .add_dessert("Fresh Fruit")
-        .build()
-    )
-
-    print("Breakfast:")
-    print(breakfast)
-
-    # Build a lunch meal
-    lunch = (
-        builder.reset()
-        .add_main("Grilled Chicken Sandwich")
-        .add_side("French Fries")
-        .add_drink("Iced Tea")
-        .build()
-    )
-
-    print("\nLunch:")
-    print(lunch)
-
-    # Build a dinner meal
-    dinner = (
-        builder.reset()
-        .add_main("Steak")
-        .add_side("Mashed Potatoes")
-        .add_side("Steamed Vegetables")
-        .add_drink("Red Wine")
-        .add_dessert("Chocolate Cake")
-        .build()
-    )
-
-    print("\nDinner:")
-    print(dinner)
+    demonstrate_classic_builder()
+    demonstrate_fluent_builder()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import unittest
 
+import builder_pattern
 from builder_pattern.meal import Meal, MealItem
 from builder_pattern.concrete_builders import (
     RegularMealBuilder,
@@ -8,6 +9,7 @@ from builder_pattern.concrete_builders import (
 )
 from builder_pattern.meal_director import MealDirector, MealConfig
 from builder_pattern.fluent_builder import FluentMealBuilder
+from builder_pattern.meal_builder import MealBuilder
 
 
 class TestBuilderPattern(unittest.TestCase):
@@ -75,7 +77,7 @@ class TestBuilderPattern(unittest.TestCase):
         self.assertEqual(meal.side_dish, MealItem.SALAD)
         self.assertEqual(meal.drink, MealItem.JUICE)
         self.assertEqual(meal.dessert, MealItem.FRUIT)
-        self.assertEqual(meal.extras, [MealItem.SALAD])  # Extra veggies
+        self.assertEqual(meal.extras, (MealItem.SALAD,))  # Extra veggies
         self.assertTrue(meal.is_vegetarian)
         self.assertIn("Gluten", meal.contains_allergens)
         self.assertEqual(meal.total_items(), 5)  # main, side, drink, dessert, 1 extra
@@ -107,11 +109,52 @@ class TestBuilderPattern(unittest.TestCase):
         self.assertEqual(meal.side_dish, MealItem.FRIES)
         self.assertEqual(meal.drink, MealItem.JUICE)
         self.assertEqual(meal.dessert, MealItem.ICE_CREAM)
-        self.assertEqual(meal.extras, [MealItem.TOY])
+        self.assertEqual(meal.extras, (MealItem.TOY,))
         self.assertTrue(meal.is_kids_meal)
         self.assertIn("Dairy", meal.contains_allergens)
         self.assertEqual(meal.total_items(), 5)  # main, side, drink, dessert, toy
 
+    def test_builder_from_spec(self):
+        """
+        Test that a builder declared through SPEC gets working add_* methods
+        """
+
+        class FishMealBuilder(MealBuilder):
+            SPEC = {
+                "main_dish": (MealItem.FISH, ("Fish",)),
+                "side_dish": (MealItem.RICE, ()),
+                "drink": (MealItem.WATER, ()),
+                "dessert": (MealItem.CAKE, ("Dairy", "Gluten")),
+            }
+
+        builder = FishMealBuilder()
+        builder.add_main_dish()
+        builder.add_dessert()
+        builder.apply_spec("drink")
+        meal = builder.get_meal()
+
+        self.assertEqual(meal.main_dish, MealItem.FISH)
+        self.assertEqual(meal.drink, MealItem.WATER)
+        self.assertEqual(meal.dessert, MealItem.CAKE)
+        self.assertIsNone(meal.side_dish)
+        self.assertEqual(meal.contains_allergens, ["Fish", "Dairy", "Gluten"])
+
+    def test_builder_reset_uses_fresh_containers(self):
+        """
+        Test that meals started from a builder's presets do not share state
+        """
+        builder = VegetarianMealBuilder()
+        builder.add_main_dish()
+        builder.add_extras()
+        first = builder.get_meal()
+        second = builder.get_meal()
+
+        self.assertTrue(second.is_vegetarian)
+        self.assertEqual(first.extras, (MealItem.SALAD,))
+        self.assertEqual(second.extras, ())
+        self.assertEqual(second.contains_allergens, [])
+        self.assertEqual(VegetarianMealBuilder._PRESETS, {"is_vegetarian": True})
+
     def test_meal_director(self):
         """
         Test the MealDirector with different builders
@@ -247,12 +290,159 @@ class TestBuilderPattern(unittest.TestCase):
         self.assertEqual(kids_vegetarian_meal.price, 8.99)
         self.assertEqual(kids_vegetarian_meal.main_dish, MealItem.PASTA)
         self.assertEqual(kids_vegetarian_meal.drink, MealItem.JUICE)
-        self.assertEqual(kids_vegetarian_meal.extras, [MealItem.TOY])
+        self.assertEqual(kids_vegetarian_meal.extras, (MealItem.TOY,))
         self.assertTrue(kids_vegetarian_meal.is_vegetarian)
         self.assertTrue(kids_vegetarian_meal.is_kids_meal)
         self.assertIn("Gluten", kids_vegetarian_meal.contains_allergens)
         self.assertEqual(kids_vegetarian_meal.total_items(), 3)  # main, drink, toy
 
+    def test_fluent_builder_from_spec(self):
+        """
+        Test that from_spec() builds the same meal as the chained calls
+        """
+        chained = (
+            FluentMealBuilder()
+            .with_name("Spec Meal")
+            .with_price(11.49)
+            .with_main_dish(MealItem.FISH)
+            .with_drink(MealItem.WATER)
+            .with_dessert(MealItem.CAKE)
+            .with_allergen("Sesame")
+            .with_extras([MealItem.TOY])
+            .with_nutrition_info({"calories": 650})
+            .kids_meal()
+            .build()
+        )
+        from_spec = FluentMealBuilder.from_spec(
+            {
+                "name": "Spec Meal",
+                "price": 11.49,
+                "main_dish": MealItem.FISH,
+                "drink": MealItem.WATER,
+                "dessert": MealItem.CAKE,
+                "contains_allergens": ["Sesame"],
+                "extras": [MealItem.TOY],
+                "nutrition_info": {"calories": 650},
+                "is_kids_meal": True,
+            }
+        )
+
+        self.assertEqual(from_spec, chained)
+        self.assertEqual(FluentMealBuilder.from_spec({}).name, "Custom Meal")
+        with self.assertRaises(ValueError):
+            FluentMealBuilder.from_spec({"name": "Bad", "sauce": "Ketchup"})
+
+    def test_fluent_builder_from_spec_with_plain_strings(self):
+        """
+        Test that from_spec() accepts meal items by their display names
+        """
+        meal = FluentMealBuilder.from_spec(
+            {"name": "JSON Meal", "main_dish": "Burger", "extras": ["Toy"]}
+        )
+
+        self.assertIs(meal.main_dish, MealItem.BURGER)
+        self.assertEqual(meal.extras, (MealItem.TOY,))
+        self.assertEqual(meal.contains_allergens, ["Gluten"])
+        self.assertEqual(
+            meal.display(),
+            "=== JSON Meal ===\nMain: Burger\nExtras: Toy\nAllergens: Gluten",
+        )
+        with self.assertRaises(ValueError):
+            FluentMealBuilder.from_spec({"main_dish": "Pizza"})
+
+    def test_fluent_builder_from_spec_with_null_fields(self):
+        """
+        Test that from_spec() treats None container fields as missing
+        """
+        meal = FluentMealBuilder.from_spec(
+            {
+                "name": "Null Meal",
+                "extras": None,
+                "contains_allergens": None,
+                "nutrition_info": None,
+            }
+        )
+
+        self.assertEqual(meal.extras, ())
+        self.assertEqual(meal.contains_allergens, [])
+        self.assertEqual(meal.nutrition_info, {})
+
+    def test_fluent_builder_starts_over_after_build(self):
+        """
+        Test that build() hands over the meal and resets the FluentMealBuilder
+        """
+        builder = FluentMealBuilder().with_name("First").with_dessert(MealItem.CAKE)
+        first = builder.build()
+        second = builder.with_name("Second").build()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.dessert, MealItem.CAKE)
+        self.assertIsNone(second.dessert)
+        self.assertEqual(second.contains_allergens, [])
+
+    def test_fluent_builder_deduplicates_allergens(self):
+        """
+        Test that allergens are recorded once, in the order they were added
+        """
+        meal = (
+            FluentMealBuilder()
+            .with_main_dish(MealItem.BURGER)
+            .with_dessert(MealItem.CAKE)
+            .with_allergen("Gluten")
+            .build()
+        )
+
+        self.assertEqual(meal.contains_allergens, ["Gluten", "Dairy"])
+
+    def test_fluent_builder_interns_allergens(self):
+        """
+        Test that allergen names built at runtime are shared across meals
+        """
+        first = FluentMealBuilder().with_allergen("".join(["Se", "same"])).build()
+        second = FluentMealBuilder().with_allergen("".join(["Ses", "ame"])).build()
+
+        self.assertIs(first.contains_allergens[0], second.contains_allergens[0])
+
+    def test_fluent_builder_build_copy(self):
+        """
+        Test that build_copy() returns an independent copy of the meal
+        """
+        builder = FluentMealBuilder().with_name("Copied").with_extras([MealItem.TOY])
+        copy = builder.build_copy()
+        copy.nutrition_info["calories"] = 500
+        copy.contains_allergens.append("Nuts")
+
+        meal = builder.with_allergen("Soy").build()
+
+        self.assertEqual(copy.name, "Copied")
+        self.assertEqual(meal.extras, (MealItem.TOY,))
+        self.assertEqual(meal.nutrition_info, {})
+        self.assertEqual(meal.contains_allergens, ["Soy"])
+
+    def test_builders_use_slots(self):
+        """
+        Test that builder instances do not carry a per-instance __dict__
+        """
+        for builder in (
+            RegularMealBuilder(),
+            VegetarianMealBuilder(),
+            ChildrenMealBuilder(),
+            FluentMealBuilder(),
+        ):
+            self.assertFalse(hasattr(builder, "__dict__"))
+
+    def test_package_exports(self):
+        """
+        Test that the lazily imported package exports resolve to the classes
+        """
+        self.assertIs(builder_pattern.Meal, Meal)
+        self.assertIs(builder_pattern.FluentMealBuilder, FluentMealBuilder)
+        self.assertIs(builder_pattern.MealDirector, MealDirector)
+        for name in builder_pattern.__all__:
+            self.assertTrue(hasattr(builder_pattern, name))
+        with self.assertRaises(AttributeError):
+            builder_pattern.UnknownBuilder
+
     def test_meal_display(self):
         """
         Test the display method of Meal
@@ -284,6 +474,22 @@ class TestBuilderPattern(unittest.TestCase):
         self.assertIn("Kids Meal: Yes", display_output)
         self.assertIn("Allergens: Gluten, Dairy", display_output)
 
+    def test_meal_item_display_names(self):
+        """
+        Test that every meal item shows up in display() under its readable name
+        """
+        for item in MealItem:
+            meal = Meal(name="Item Test", main_dish=item)
+            expected = item.name.title().replace("_", " ")
+            self.assertIn(f"Main: {expected}", meal.display())
+
+    def test_meal_uses_slots(self):
+        """
+        Test that meals and meal configs do not carry a per-instance __dict__
+        """
+        self.assertFalse(hasattr(Meal(name="Slotted"), "__dict__"))
+        self.assertFalse(hasattr(MealConfig(name="Slotted", price=1.0), "__dict__"))
+
     def test_meal_total_items(self):
         """
         Test the total_items method of Meal
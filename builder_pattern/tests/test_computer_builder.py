@@ -45,3 +45,37 @@ def test_computer_builder_no_case():
         assert False, "Should have raised ValueError"
     except ValueError as e:
         assert str(e) == "Computer case is required"
+
+
+def test_computer_builder_with_components():
+    """Test setting several components in a single call."""
+    computer = (
+        ComputerBuilder()
+        .with_components(case="Mini ITX", cpu="Ryzen 7", gpu="RX 7800")
+        .with_memory("16GB DDR5")
+        .build()
+    )
+
+    assert computer.case == "Mini ITX"
+    assert computer.cpu == "Ryzen 7"
+    assert computer.gpu == "RX 7800"
+    assert computer.memory == "16GB DDR5"
+    assert computer.storage is None
+
+
+def test_computer_builder_with_unknown_component():
+    """Test that unknown component names are rejected."""
+    builder = ComputerBuilder()
+    try:
+        builder.with_components(case="ATX", keyboard="Mechanical")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert str(e) == "Unknown computer components: keyboard"
+
+
+def test_computer_builder_uses_slots():
+    """Test that builders and computers do not carry a per-instance __dict__."""
+    builder = ComputerBuilder().with_case("ATX Mid Tower")
+
+    assert not hasattr(builder, "__dict__")
+    assert not hasattr(builder.build(), "__dict__")
@@ -1,7 +1,10 @@
 """Base document class for the Factory Pattern example."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
+
+# Metadata keys answered by the document's own attributes
+_ATTRIBUTE_METADATA: FrozenSet[str] = frozenset({"title", "author"})
 
 
 class Document(ABC):
@@ -11,6 +14,8 @@ class Document(ABC):
     This class defines the common interface for all document types.
     """
 
+    __slots__ = ("title", "author", "content", "_extra_metadata")
+
     def __init__(self, title: str, author: str, content: str = "") -> None:
         """
         Initialize a new document.
@@ -23,10 +28,20 @@ class Document(ABC):
         self.title = title
         self.author = author
         self.content = content
-        self._metadata: Dict[str, Any] = {
-            "title": title,
-            "author": author,
-        }
+        # Title and author are served from the attributes above; the dict
+        # only holds the other metadata, such as each type's format
+        self._extra_metadata: Dict[str, Any] = {}
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Get all metadata of the document.
+
+        Returns:
+            Dict[str, Any]: A new dictionary with the title, author and any
+            metadata added to the document
+        """
+        return {"title": self.title, "author": self.author, **self._extra_metadata}
 
     def add_metadata(self, key: str, value: Any) -> None:
         """
@@ -36,7 +51,7 @@ class Document(ABC):
             key: The metadata key
             value: The metadata value
         """
-        self._metadata[key] = value
+        self._extra_metadata[key] = value
 
     def get_metadata(self, key: str) -> Optional[Any]:
         """
@@ -48,7 +63,12 @@ class Document(ABC):
         Returns:
             Optional[Any]: The metadata value or None if the key doesn't exist
         """
-        return self._metadata.get(key)
+        extra_metadata = self._extra_metadata
+        if key in extra_metadata:
+            return extra_metadata[key]
+        if key in _ATTRIBUTE_METADATA:
+            return getattr(self, key)
+        return None
 
     @abstractmethod
     def create(self) -> str:
@@ -1,6 +1,9 @@
 """Document factory implementation."""
 
-from typing import Dict, Type, Union
+import sys
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Type, Union
 from .document import Document
 from .document_types import (
     PDFDocument,
@@ -9,6 +12,29 @@ from .document_types import (
     DocumentType,
 )
 
+# Converts a document type of the given Python type to its registry key.
+# Subclasses use their nearest listed base; other types fall back to str().
+_NORMALIZERS: Dict[type, Callable[[Any], str]] = {
+    DocumentType: attrgetter("value"),
+    str: str.lower,
+    int: str,
+}
+
+
+def _normalize_doc_type(doc_type: Union[DocumentType, str, int]) -> str:
+    """Return the registry key for a document type."""
+    normalizer = _NORMALIZERS.get(type(doc_type))
+    if normalizer is None:
+        normalizer = next(
+            (
+                _NORMALIZERS[base]
+                for base in type(doc_type).__mro__
+                if base in _NORMALIZERS
+            ),
+            str,
+        )
+    return normalizer(doc_type)
+
 
 class DocumentFactory:
     """Factory for creating different types of documents."""
@@ -19,6 +45,13 @@ class DocumentFactory:
         DocumentType.HTML.value: HTMLDocument,
     }
 
+    # Bumped on every registration change so get_registered_types() knows
+    # when its cached snapshot is out of date. Always updated on
+    # DocumentFactory, which owns _document_types, so subclasses share it.
+    _registry_version: int = 0
+    _registered_view: Optional[Mapping[str, Type[Document]]] = None
+    _registered_view_version: int = -1
+
     @classmethod
     def create_document(
         cls,
@@ -42,20 +75,14 @@ class DocumentFactory:
         Raises:
             ValueError: If the document type is not supported
         """
-        if isinstance(doc_type, DocumentType):
-            doc_type = doc_type.value
-        elif isinstance(doc_type, str):
-            doc_type = doc_type.lower()
-
-        doc_type_str = str(doc_type)
-        if doc_type_str not in cls._document_types:
+        document_class = cls._document_types.get(_normalize_doc_type(doc_type))
+        if document_class is None:
             supported = ", ".join(cls._document_types.keys())
             raise ValueError(
                 f"Unsupported document type: {doc_type}. "
                 f"Supported types are: {supported}"
             )
 
-        document_class = cls._document_types[doc_type_str]
         return document_class(title, author, content)
 
     @classmethod
@@ -65,20 +92,53 @@ class DocumentFactory:
         """
         Register a new document type.
 
+        String types are stored lowercased, the same way create_document()
+        looks them up, so "PDF2" is registered under "pdf2".
+
         Args:
             doc_type: The document type enum, string, or integer
             document_class: The class to instantiate for this document type
         """
-        if isinstance(doc_type, DocumentType):
-            doc_type = doc_type.value
-        cls._document_types[str(doc_type)] = document_class
+        key = sys.intern(_normalize_doc_type(doc_type))
+        cls._document_types[key] = document_class
+        DocumentFactory._registry_version += 1
+
+    @classmethod
+    def unregister_document_type(
+        cls, doc_type: Union[str, DocumentType, int]
+    ) -> Type[Document]:
+        """
+        Remove a registered document type.
+
+        Args:
+            doc_type: The document type enum, string, or integer
+
+        Returns:
+            The class that was registered for this document type
+
+        Raises:
+            ValueError: If the document type is not registered
+        """
+        try:
+            document_class = cls._document_types.pop(_normalize_doc_type(doc_type))
+        except KeyError:
+            raise ValueError(f"Unregistered document type: {doc_type}") from None
+        DocumentFactory._registry_version += 1
+        return document_class
 
     @classmethod
-    def get_registered_types(cls) -> Dict[str, Type[Document]]:
+    def get_registered_types(cls) -> Mapping[str, Type[Document]]:
         """
         Get all registered document types.
 
+        The snapshot is cached and only rebuilt after a new type has been
+        registered. Use ``dict(...)`` on the result to get a mutable copy.
+
         Returns:
-            A dictionary mapping document types to their classes
+            A read-only mapping of document types to their classes
         """
-        return cls._document_types.copy()
+        version = DocumentFactory._registry_version
+        if cls._registered_view_version != version:
+            cls._registered_view = MappingProxyType(dict(cls._document_types))
+            cls._registered_view_version = version
+        return cls._registered_view
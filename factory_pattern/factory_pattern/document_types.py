@@ -20,6 +20,8 @@ class PDFDocument(Document):
     Concrete Product: PDF Document implementation.
     """
 
+    __slots__ = ()
+
     def __init__(self, title: str, author: str, content: str = ""):
         """
         Initialize a PDF document.
@@ -150,6 +152,8 @@ class WordDocument(Document):
     Concrete Product: Word Document implementation.
     """
 
+    __slots__ = ()
+
     def __init__(self, title: str, author: str, content: str = ""):
         """
         Initialize a Word document.
@@ -245,6 +249,8 @@ class HTMLDocument(Document):
     Concrete Product: HTML Document implementation.
     """
 
+    __slots__ = ("css",)
+
     def __init__(self, title: str, author: str, content: str = ""):
         """
         Initialize an HTML document.
@@ -355,6 +361,8 @@ class HTMLDocument(Document):
 class MarkdownDocument(Document):
     """Markdown document implementation."""
 
+    __slots__ = ()
+
     def create(self) -> str:
         """Create a Markdown document."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -372,6 +380,8 @@ class MarkdownDocument(Document):
 class TextDocument(Document):
     """Plain text document implementation."""
 
+    __slots__ = ()
+
     def create(self) -> str:
         """Create a plain text document."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1,6 +1,8 @@
-import unittest
-import os
-import tempfile
+from enum import Enum
+from typing import NamedTuple, Type
+
+import pytest
+
 from factory_pattern.document import Document
 from factory_pattern.document_factory import DocumentFactory
 from factory_pattern.document_types import (
@@ -11,238 +13,283 @@ from factory_pattern.document_types import (
 )
 
 
-class TestDocumentFactory(unittest.TestCase):
-    """
-    Test cases for the document factory implementation.
-    """
-
-    def setUp(self):
-        """
-        Set up test data.
-        """
-        self.title = "Test Document"
-        self.author = "Test Author"
-        self.content = "This is test content for the document."
-
-    def test_create_pdf_document(self):
-        """
-        Test creating a PDF document.
-        """
-        # Create a PDF document
-        document = DocumentFactory.create_document(
-            DocumentType.PDF, self.title, self.author, self.content
-        )
-
-        # Verify document type
-        self.assertIsInstance(document, PDFDocument)
-
-        # Verify document properties
-        self.assertEqual(document.title, self.title)
-        self.assertEqual(document.author, self.author)
-        self.assertEqual(document.content, self.content)
-
-        # Check document metadata
-        self.assertEqual(document.get_metadata("format"), "PDF")
-        self.assertEqual(document.get_metadata("version"), "1.7")
-
-    def test_create_word_document(self):
-        """
-        Test creating a Word document.
-        """
-        # Create a Word document
-        document = DocumentFactory.create_document(
-            DocumentType.WORD, self.title, self.author, self.content
-        )
-
-        # Verify document type
-        self.assertIsInstance(document, WordDocument)
-
-        # Verify document properties
-        self.assertEqual(document.title, self.title)
-        self.assertEqual(document.author, self.author)
-        self.assertEqual(document.content, self.content)
-
-        # Check document metadata
-        self.assertEqual(document.get_metadata("format"), "DOCX")
-        self.assertEqual(document.get_metadata("version"), "Office Open XML")
-
-    def test_create_html_document(self):
-        """
-        Test creating an HTML document.
-        """
-        # Create an HTML document
-        document = DocumentFactory.create_document(
-            DocumentType.HTML, self.title, self.author, self.content
-        )
-
-        # Verify document type
-        self.assertIsInstance(document, HTMLDocument)
-
-        # Verify document properties
-        self.assertEqual(document.title, self.title)
-        self.assertEqual(document.author, self.author)
-        self.assertEqual(document.content, self.content)
-
-        # Check document metadata
-        self.assertEqual(document.get_metadata("format"), "HTML")
-        self.assertEqual(document.get_metadata("version"), "HTML5")
-
-    def test_invalid_document_type(self):
-        """
-        Test creating a document with an invalid type.
-        """
-        # Try to create a document with an invalid type
-        with self.assertRaises(ValueError):
-            DocumentFactory.create_document(
-                "INVALID_TYPE", self.title, self.author, self.content
-            )
-
-    def test_register_document_type(self):
-        """
-        Test registering a new document type.
-        """
-
-        # Create a new document class
-        class TestDocument(Document):
-            def __init__(self, title, author, content=""):
-                super().__init__(title, author, content)
-                self.add_metadata("format", "TEST")
-
-            def create(self) -> str:
-                """Create a test document."""
-                return f"TEST:{self.title}:{self.author}:{self.content}"
-
-            def generate(self):
-                return f"TEST:{self.title}:{self.author}:{self.content}"
-
-            def save(self, path):
-                return True
-
-        # Create a new document type
-        class NewDocumentType:
-            TEST = 999
-
-        # Register the new document type
-        DocumentFactory.register_document_type(NewDocumentType.TEST, TestDocument)
-
-        # Create a document with the new type
-        document = DocumentFactory.create_document(
-            NewDocumentType.TEST, self.title, self.author, self.content
-        )
-
-        # Verify document type
-        self.assertIsInstance(document, TestDocument)
-
-        # Verify document properties
-        self.assertEqual(document.title, self.title)
-        self.assertEqual(document.author, self.author)
-        self.assertEqual(document.content, self.content)
-
-        # Verify document format
-        self.assertEqual(document.get_metadata("format"), "TEST")
-
-    def test_pdf_document_generate(self):
-        """
-        Test generating a PDF document.
-        """
-        # Create a PDF document
-        document = DocumentFactory.create_document(
-            DocumentType.PDF, self.title, self.author, self.content
-        )
-
-        # Generate the document
-        output = document.generate()
-
-        # Verify PDF content
-        self.assertIn("%PDF-1.7", output)
-        self.assertIn(self.title, output)
-        self.assertIn(self.author, output)
-        self.assertIn(self.content, output)
-
-    def test_word_document_generate(self):
-        """
-        Test generating a Word document.
-        """
-        # Create a Word document
-        document = DocumentFactory.create_document(
-            DocumentType.WORD, self.title, self.author, self.content
-        )
-
-        # Generate the document
-        output = document.generate()
-
-        # Verify Word content
-        self.assertIn('<?xml version="1.0"', output)
-        self.assertIn(self.title, output)
-        self.assertIn(self.author, output)
-        self.assertIn(self.content, output)
-
-    def test_html_document_generate(self):
-        """
-        Test generating an HTML document.
-        """
-        # Create an HTML document
-        document = DocumentFactory.create_document(
-            DocumentType.HTML, self.title, self.author, self.content
-        )
-
-        # Generate the document
-        output = document.generate()
-
-        # Verify HTML content
-        self.assertIn("<!DOCTYPE html>", output)
-        self.assertIn(self.title, output)
-        self.assertIn(self.author, output)
-        self.assertIn(self.content, output)
-
-    def test_save_documents(self):
-        """
-        Test saving documents to files.
-        """
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test saving PDF document
-            pdf_document = DocumentFactory.create_document(
-                DocumentType.PDF, self.title, self.author, self.content
-            )
-            pdf_path = os.path.join(temp_dir, "test.pdf")
-            self.assertTrue(pdf_document.save(pdf_path))
-            self.assertTrue(os.path.exists(pdf_path))
-
-            # Test saving Word document
-            word_document = DocumentFactory.create_document(
-                DocumentType.WORD, self.title, self.author, self.content
-            )
-            word_path = os.path.join(temp_dir, "test.docx")
-            self.assertTrue(word_document.save(word_path))
-            self.assertTrue(os.path.exists(word_path))
-
-            # Test saving HTML document
-            html_document = DocumentFactory.create_document(
-                DocumentType.HTML, self.title, self.author, self.content
-            )
-            html_path = os.path.join(temp_dir, "test.html")
-            self.assertTrue(html_document.save(html_path))
-            self.assertTrue(os.path.exists(html_path))
-
-    def test_document_metadata(self):
-        """
-        Test document metadata.
-        """
-        # Create a document
-        document = DocumentFactory.create_document(
-            DocumentType.PDF, self.title, self.author, self.content
-        )
-
-        # Verify metadata
-        self.assertEqual(document.get_metadata("format"), "PDF")
-        self.assertEqual(document.get_metadata("version"), "1.7")
-        self.assertEqual(document.get_metadata("title"), self.title)
-        self.assertEqual(document.get_metadata("author"), self.author)
-
-        # Test non-existent metadata
-        self.assertIsNone(document.get_metadata("non_existent"))
-
-
-if __name__ == "__main__":
-    unittest.main()
+class DocumentCase(NamedTuple):
+    """Expected behaviour of one built-in document type."""
+
+    doc_type: DocumentType
+    document_class: Type[Document]
+    doc_format: str
+    version: str
+    marker: str
+    filename: str
+
+
+# Built-in document types, shared by every per-format test below
+DOCUMENT_CASES = [
+    DocumentCase(DocumentType.PDF, PDFDocument, "PDF", "1.7", "%PDF-1.7", "test.pdf"),
+    DocumentCase(
+        DocumentType.WORD,
+        WordDocument,
+        "DOCX",
+        "Office Open XML",
+        '<?xml version="1.0"',
+        "test.docx",
+    ),
+    DocumentCase(
+        DocumentType.HTML, HTMLDocument, "HTML", "HTML5", "<!DOCTYPE html>", "test.html"
+    ),
+]
+CASE_IDS = [case.doc_type.value for case in DOCUMENT_CASES]
+
+# Title, author and content shared by the documents under test
+TITLE = "Test Document"
+AUTHOR = "Test Author"
+CONTENT = "This is test content for the document."
+DOC_ARGS = (TITLE, AUTHOR, CONTENT)
+
+
+@pytest.fixture(scope="module")
+def docs():
+    """
+    One document per built-in type, shared by the read-only tests.
+    """
+    return {
+        case.doc_type: DocumentFactory.create_document(case.doc_type, *DOC_ARGS)
+        for case in DOCUMENT_CASES
+    }
+
+
+@pytest.fixture(scope="module")
+def docs_dir(tmp_path_factory):
+    """
+    Temporary directory shared by the save tests; each writes its own file.
+    """
+    return tmp_path_factory.mktemp("docs")
+
+
+@pytest.mark.parametrize("case", DOCUMENT_CASES, ids=CASE_IDS)
+def test_create_document(docs, case):
+    """
+    Test creating a document of each built-in type.
+    """
+    document = docs[case.doc_type]
+
+    # Verify document type
+    assert isinstance(document, case.document_class)
+
+    # Verify document properties
+    assert document.title == TITLE
+    assert document.author == AUTHOR
+    assert document.content == CONTENT
+
+    # Check document metadata
+    assert document.get_metadata("format") == case.doc_format
+    assert document.get_metadata("version") == case.version
+
+
+def test_create_document_from_string():
+    """
+    Test that string document types are matched case-insensitively.
+    """
+    document = DocumentFactory.create_document("PDF", *DOC_ARGS)
+    assert isinstance(document, PDFDocument)
+
+    DocumentFactory.register_document_type("Memo", WordDocument)
+    try:
+        document = DocumentFactory.create_document("memo", *DOC_ARGS)
+        assert isinstance(document, WordDocument)
+    finally:
+        DocumentFactory.unregister_document_type("memo")
+
+
+def test_create_document_from_str_subclass():
+    """
+    Test that str subclasses and str-based enums are lowercased like str.
+    """
+
+    class DocName(str):
+        pass
+
+    class Format(str, Enum):
+        PAGE = "HTML"
+
+    document = DocumentFactory.create_document(DocName("Word"), *DOC_ARGS)
+    assert isinstance(document, WordDocument)
+
+    document = DocumentFactory.create_document(Format.PAGE, *DOC_ARGS)
+    assert isinstance(document, HTMLDocument)
+
+
+def test_get_registered_types():
+    """
+    Test that the registered types snapshot is reused until a type is added.
+    """
+    registered = DocumentFactory.get_registered_types()
+    assert registered["pdf"] is PDFDocument
+    assert DocumentFactory.get_registered_types() is registered
+    with pytest.raises(TypeError):
+        registered["pdf"] = WordDocument
+
+    DocumentFactory.register_document_type("Report", PDFDocument)
+    try:
+        updated = DocumentFactory.get_registered_types()
+        assert updated is not registered
+        assert updated["report"] is PDFDocument
+        assert "report" not in registered
+    finally:
+        DocumentFactory.unregister_document_type("report")
+
+
+def test_register_document_type_lowercases_strings():
+    """
+    Test that string types are registered under their lowercased name.
+    """
+    DocumentFactory.register_document_type("PDF2", PDFDocument)
+    try:
+        registered = DocumentFactory.get_registered_types()
+        assert registered["pdf2"] is PDFDocument
+        assert "PDF2" not in registered
+        document = DocumentFactory.create_document("PDF2", *DOC_ARGS)
+        assert isinstance(document, PDFDocument)
+    finally:
+        DocumentFactory.unregister_document_type("PDF2")
+
+
+def test_registered_types_follow_subclass_registration():
+    """
+    Test that a registration through a subclass refreshes the base snapshot.
+    """
+
+    class CustomFactory(DocumentFactory):
+        pass
+
+    registered = DocumentFactory.get_registered_types()
+    CustomFactory.register_document_type("Brief", WordDocument)
+    try:
+        assert DocumentFactory.get_registered_types()["brief"] is WordDocument
+    finally:
+        assert CustomFactory.unregister_document_type("brief") is WordDocument
+
+    assert DocumentFactory.get_registered_types() == registered
+    with pytest.raises(ValueError):
+        DocumentFactory.unregister_document_type("brief")
+
+
+def test_invalid_document_type():
+    """
+    Test creating a document with an invalid type.
+    """
+    # Try to create a document with an invalid type
+    with pytest.raises(ValueError):
+        DocumentFactory.create_document("INVALID_TYPE", *DOC_ARGS)
+
+
+def test_register_document_type():
+    """
+    Test registering a new document type.
+    """
+
+    # Create a new document class
+    class TestDocument(Document):
+        def __init__(self, title, author, content=""):
+            super().__init__(title, author, content)
+            self.add_metadata("format", "TEST")
+
+        def create(self) -> str:
+            """Create a test document."""
+            return f"TEST:{self.title}:{self.author}:{self.content}"
+
+        def generate(self):
+            return f"TEST:{self.title}:{self.author}:{self.content}"
+
+        def save(self, path):
+            return True
+
+    # Create a new document type
+    class NewDocumentType:
+        TEST = 999
+
+    # Register the new document type
+    DocumentFactory.register_document_type(NewDocumentType.TEST, TestDocument)
+
+    # Create a document with the new type
+    document = DocumentFactory.create_document(
+        NewDocumentType.TEST, TITLE, AUTHOR, CONTENT
+    )
+
+    # Verify document type
+    assert isinstance(document, TestDocument)
+
+    # Verify document properties
+    assert document.title == TITLE
+    assert document.author == AUTHOR
+    assert document.content == CONTENT
+
+    # Verify document format
+    assert document.get_metadata("format") == "TEST"
+
+
+@pytest.mark.parametrize("case", DOCUMENT_CASES, ids=CASE_IDS)
+def test_document_generate(docs, case):
+    """
+    Test generating a document of each built-in type.
+    """
+    document = docs[case.doc_type]
+
+    # Generate the document
+    output = document.generate()
+
+    # Verify generated content
+    assert case.marker in output
+    assert TITLE in output
+    assert AUTHOR in output
+    assert CONTENT in output
+
+
+@pytest.mark.parametrize("case", DOCUMENT_CASES, ids=CASE_IDS)
+def test_save_document(docs, docs_dir, case):
+    """
+    Test saving a document of each built-in type to a file.
+    """
+    document = docs[case.doc_type]
+
+    path = docs_dir / case.filename
+    assert document.save(str(path))
+    assert path.exists()
+
+
+def test_document_metadata():
+    """
+    Test document metadata.
+    """
+    # Create a document
+    document = DocumentFactory.create_document(DocumentType.PDF, TITLE, AUTHOR, CONTENT)
+
+    # Verify metadata
+    assert document.get_metadata("format") == "PDF"
+    assert document.get_metadata("version") == "1.7"
+    assert document.get_metadata("title") == TITLE
+    assert document.get_metadata("author") == AUTHOR
+
+    # Test non-existent metadata
+    assert document.get_metadata("non_existent") is None
+
+    # Added metadata takes precedence over the document attributes
+    document.add_metadata("title", "Metadata Title")
+    assert document.get_metadata("title") == "Metadata Title"
+    assert document.title == TITLE
+    assert document.metadata == {
+        "title": "Metadata Title",
+        "author": AUTHOR,
+        "format": "PDF",
+        "version": "1.7",
+    }
+
+
+@pytest.mark.parametrize("case", DOCUMENT_CASES, ids=CASE_IDS)
+def test_documents_use_slots(docs, case):
+    """
+    Test that documents do not carry a per-instance __dict__.
+    """
+    document = docs[case.doc_type]
+    assert not hasattr(document, "__dict__")
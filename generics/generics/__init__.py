@@ -2,13 +2,17 @@
 Generic programming examples in Python.
 """
 
-from .stack import Stack
-from .result import Result
+from .stack import Stack, BoolStack
+from .result import Result, Ok, Err, ResultError
 from .repository import Repository, InMemoryRepository, Identifiable, RepositoryError
 
 __all__ = [
     "Stack",
+    "BoolStack",
     "Result",
+    "Ok",
+    "Err",
+    "ResultError",
     "Repository",
     "InMemoryRepository",
     "Identifiable",
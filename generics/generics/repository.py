@@ -5,17 +5,41 @@ This module demonstrates the use of generic protocols and bounded type parameter
 through a Repository pattern implementation.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Protocol, TypeVar, Generic, Dict, List, Any, Hashable
+from functools import lru_cache
+from typing import (
+    Protocol,
+    TypeVar,
+    Generic,
+    Dict,
+    List,
+    Any,
+    Hashable,
+    Iterable,
+    Optional,
+)
 from .result import Result
 
 
 class Unit:
     """Represents a void or no-value return type."""
 
+    __slots__ = ()
+    _instance: Optional["Unit"] = None
+
+    def __new__(cls) -> "Unit":
+        # Unit carries no data, so every Unit() is the same object. The
+        # instance is looked up on cls itself, so subclasses get their own.
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Unit)
+        return other is self
+
+    def __hash__(self) -> int:
+        return 0
 
     def __repr__(self) -> str:
         return "Unit"
@@ -38,19 +62,22 @@ class Identifiable(Protocol[ID]):
 T = TypeVar("T", bound="Identifiable[Any]")
 
 
-@dataclass
+@dataclass(frozen=True)
 class RepositoryError:
     """Represents errors that can occur in repository operations."""
 
     message: str
     code: str
 
+    # Errors are frozen, so repeated misses can share one cached instance
     @classmethod
+    @lru_cache(maxsize=1024, typed=True)
     def not_found(cls, id: Any) -> "RepositoryError":
         """Create a not found error."""
         return cls(f"Entity with id '{id}' not found", "NOT_FOUND")
 
     @classmethod
+    @lru_cache(maxsize=1024, typed=True)
     def already_exists(cls, id: Any) -> "RepositoryError":
         """Create an already exists error."""
         return cls(f"Entity with id '{id}' already exists", "ALREADY_EXISTS")
@@ -61,10 +88,20 @@ class RepositoryError:
         return cls(message, "VALIDATION_ERROR")
 
 
-class Repository(Generic[T, ID], ABC):
+# Marks a missing entry, so falsy entities are still found
+_SENTINEL = object()
+
+# Results are never mutated, so every successful delete can share this one
+_OK_UNIT: "Result[Unit, RepositoryError]" = Result.ok(Unit())
+
+
+class Repository(Protocol[T, ID]):
     """
     Generic repository interface for storing and retrieving objects.
 
+    This is a structural protocol: any class with matching methods is a
+    Repository, without inheriting from it.
+
     Type Parameters:
         T: The type of objects stored in the repository.
            Must implement the Identifiable protocol.
@@ -77,14 +114,15 @@ class Repository(Generic[T, ID], ABC):
         ...     id: int  # Using integer IDs
         ...     name: str
         ...
-        >>> class UserRepository(Repository[User, int]):
+        >>> class UserRepository:
         ...     def __init__(self):
         ...         self._users: Dict[int, User] = {}
         ...
         ...     def find_by_id(self, id: int) -> Result[User, RepositoryError]:
-        ...         if user := self._users.get(id):
-        ...             return Result.ok(user)
-        ...         return Result.err(RepositoryError.not_found(id))
+        ...         user = self._users.get(id, _SENTINEL)
+        ...         if user is _SENTINEL:
+        ...             return Result.err(RepositoryError.not_found(id))
+        ...         return Result.ok(user)
         ...
         >>> from uuid import UUID
         >>> @dataclass
@@ -92,12 +130,13 @@ class Repository(Generic[T, ID], ABC):
         ...     id: UUID  # Using UUID for IDs
         ...     title: str
         ...
-        >>> class PostRepository(Repository[Post, UUID]):
+        >>> class PostRepository:
         ...     # Implementation with UUID keys
         ...     pass
+        ...
+        >>> users: Repository[User, int] = UserRepository()
     """
 
-    @abstractmethod
     def find_by_id(self, id: ID) -> "Result[T, RepositoryError]":
         """
         Find an entity by its ID.
@@ -110,7 +149,6 @@ class Repository(Generic[T, ID], ABC):
         """
         ...
 
-    @abstractmethod
     def find_all(self) -> "Result[List[T], RepositoryError]":
         """
         Find all entities in the repository.
@@ -120,7 +158,6 @@ class Repository(Generic[T, ID], ABC):
         """
         ...
 
-    @abstractmethod
     def save(self, entity: T) -> "Result[T, RepositoryError]":
         """
         Save an entity to the repository.
@@ -133,7 +170,6 @@ class Repository(Generic[T, ID], ABC):
         """
         ...
 
-    @abstractmethod
     def delete(self, id: ID) -> "Result[Unit, RepositoryError]":
         """
         Delete an entity from the repository.
@@ -147,7 +183,7 @@ class Repository(Generic[T, ID], ABC):
         ...
 
 
-class InMemoryRepository(Repository[T, ID]):
+class InMemoryRepository(Generic[T, ID]):
     """
     In-memory implementation of the Repository interface.
 
@@ -164,21 +200,58 @@ class InMemoryRepository(Repository[T, ID]):
         self._items: Dict[ID, T] = {}
 
     def find_by_id(self, id: ID) -> "Result[T, RepositoryError]":
-        if item := self._items.get(id):
-            return Result.ok(item)
-        return Result.err(RepositoryError.not_found(id))
+        item = self._items.get(id, _SENTINEL)
+        if item is _SENTINEL:
+            return Result.err(RepositoryError.not_found(id))
+        return Result.ok(item)
 
     def find_all(self) -> "Result[List[T], RepositoryError]":
         return Result.ok(list(self._items.values()))
 
+    def find_all_iter(self) -> "Result[Iterable[T], RepositoryError]":
+        """
+        Find all entities without copying them into a list.
+
+        Returns:
+            Result containing a live view of the stored entities, which
+            reflects later saves and deletes.
+        """
+        return Result.ok(self._items.values())
+
     def save(self, entity: T) -> "Result[T, RepositoryError]":
-        if entity.id in self._items:
+        items = self._items
+        size = len(items)
+        # setdefault hashes the ID once; the size only grows if it was new
+        items.setdefault(entity.id, entity)
+        if len(items) == size:
             return Result.err(RepositoryError.already_exists(entity.id))
-        self._items[entity.id] = entity
         return Result.ok(entity)
 
+    def save_many(self, entities: Iterable[T]) -> "Result[List[T], RepositoryError]":
+        """
+        Save several entities at once.
+
+        Nothing is saved if any ID is already stored or repeated in the batch.
+
+        Args:
+            entities: The entities to save.
+
+        Returns:
+            Result containing either the saved entities or an error for the
+            first duplicate ID.
+        """
+        saved = list(entities)
+        batch: Dict[ID, T] = {}
+        for entity in saved:
+            size = len(batch)
+            batch.setdefault(entity.id, entity)
+            if len(batch) == size or entity.id in self._items:
+                return Result.err(RepositoryError.already_exists(entity.id))
+        self._items.update(batch)
+        return Result.ok(saved)
+
     def delete(self, id: ID) -> "Result[Unit, RepositoryError]":
         if id not in self._items:
             return Result.err(RepositoryError.not_found(id))
         del self._items[id]
-        return Result.ok(Unit())
+        return _OK_UNIT
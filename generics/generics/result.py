@@ -5,19 +5,46 @@ This module implements a Result type for type-safe error handling,
 similar to Rust's Result type.
 """
 
-from typing import TypeVar, Generic, Optional, Callable, Any
-from dataclasses import dataclass
-
+from abc import ABC, abstractmethod
+from typing import TypeVar, Generic, Callable, Any, Dict, Tuple
 
 T = TypeVar("T")  # Success type
 E = TypeVar("E")  # Error type
 
+# Default for an omitted constructor argument, so None is a valid payload
+_MISSING: Any = object()
+
+# Shared Err instances for repeated errors, cleared once it reaches the cap
+_ERR_CACHE: Dict[Tuple[type, type, Any], "Err[Any, Any]"] = {}
+_ERR_CACHE_SIZE = 256
+
+
+class ResultError(ValueError):
+    """
+    Raised when a Result is unwrapped as the wrong variant.
+
+    The message is only formatted when the exception is shown; the
+    payload that was found instead is kept on the payload attribute.
+    """
+
+    def __init__(self, prefix: str, payload: Any) -> None:
+        super().__init__(prefix, payload)
+        self.payload = payload
+
+    def __str__(self) -> str:
+        prefix, payload = self.args
+        return f"{prefix}{payload}"
+
 
-@dataclass
-class Result(Generic[T, E]):
+class Result(ABC, Generic[T, E]):
     """
     A type that represents either success (Ok) or failure (Err).
 
+    Result itself only declares the interface; every instance is an Ok or
+    an Err, and each subclass implements the methods with the outcome
+    already known, so no method has to branch on it. Results are never
+    mutated, so methods that leave the outcome untouched return self.
+
     Type Parameters:
         T: The type of the success value
         E: The type of the error value
@@ -36,102 +63,266 @@ class Result(Generic[T, E]):
         ...     error = result.unwrap_err()  # type: str
     """
 
-    _value: Optional[T]
-    _error: Optional[E]
-    _has_value: bool
+    __slots__ = ()
 
-    def __init__(self, value: Optional[T] = None, error: Optional[E] = None) -> None:
-        """Initialize a Result with either a value or an error."""
-        if error is not None and value is not None:
+    # Replaced below by the Ok and Err classes themselves
+    ok: Callable[[Any], "Result[Any, Any]"]
+    err: Callable[[Any], "Result[Any, Any]"]
+
+    def __new__(cls, value: Any = _MISSING, error: Any = _MISSING) -> "Result[T, E]":
+        """Create an Ok from a value or an Err from an error."""
+        if cls is not Result:
+            return super().__new__(cls)
+        if error is not _MISSING and value is not _MISSING:
             raise ValueError("Result cannot have both a value and an error")
-        if error is None and value is None:
+        if error is _MISSING and value is _MISSING:
             raise ValueError("Result must have either a value or an error")
-        self._value = value
-        self._error = error
-        self._has_value = error is None
+        if error is _MISSING:
+            return Ok(value)
+        return Err(error)
 
-    @classmethod
-    def ok(cls, value: T) -> "Result[T, Any]":
-        """Create a successful Result with a value."""
-        return cls(value=value)
+    @staticmethod
+    def pipeline(
+        value: Any, *ops: Callable[[Any], "Result[Any, Any]"]
+    ) -> "Result[Any, Any]":
+        """
+        Run operations that might fail in order, stopping at the first error.
 
-    @classmethod
-    def err(cls, error: E) -> "Result[Any, E]":
-        """Create a failed Result with an error."""
-        return cls(error=error)
+        Equivalent to Result.ok(value).and_then(op1).and_then(op2)...,
+        without wrapping the starting value in an Ok first.
+
+        Args:
+            value: The input to the first operation.
+            *ops: Operations taking the previous value and returning a Result.
 
+        Returns:
+            The first Err returned by an operation, otherwise the last
+            operation's Result (Ok(value) when there are no operations).
+        """
+        if not ops:
+            return Ok(value)
+        for op in ops:
+            result = op(value)
+            if result.is_err():
+                return result
+            value = result.unwrap()
+        return result
+
+    @abstractmethod
     def is_ok(self) -> bool:
         """Check if the Result contains a success value."""
-        return self._has_value
+        pass
 
+    @abstractmethod
     def is_err(self) -> bool:
         """Check if the Result contains an error."""
-        return not self._has_value
+        pass
 
+    @abstractmethod
     def unwrap(self) -> T:
         """Get the success value, raising an error if not successful."""
-        if not self._has_value:
-            raise ValueError(str(self._error))
-        return self._value  # type: ignore
+        pass
 
+    @abstractmethod
     def unwrap_err(self) -> E:
         """Get the error value, raising an error if successful."""
-        if self._has_value:
-            raise ValueError(f"Called unwrap_err on Ok value: {self._value}")
-        return self._error  # type: ignore
+        pass
 
+    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         """Get the success value or a default if error."""
-        return self._value if self._has_value else default  # type: ignore
+        pass
 
+    @abstractmethod
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:
         """Get the success value or compute it from the error."""
-        return self._value if self._has_value else op(self._error)  # type: ignore
+        pass
 
+    @abstractmethod
     def expect(self, msg: str) -> T:
         """Get the success value or raise an error with a custom message."""
-        if not self._has_value:
-            raise ValueError(f"{msg}: {self._error}")
-        return self._value  # type: ignore
+        pass
 
+    @abstractmethod
     def expect_err(self, msg: str) -> E:
         """Get the error value or raise an error with a custom message."""
-        if self._has_value:
-            raise ValueError(f"{msg}: {self._value}")
-        return self._error  # type: ignore
+        pass
 
+    @abstractmethod
     def map(self, op: Callable[[T], T]) -> "Result[T, E]":
         """Apply a function to the success value if present."""
-        if not self._has_value:
-            return Result(error=self._error)
-        return Result(value=op(self._value))  # type: ignore
+        pass
 
+    @abstractmethod
     def map_err(self, op: Callable[[E], E]) -> "Result[T, E]":
         """Apply a function to the error value if present."""
-        if self._has_value:
-            return Result(value=self._value)
-        return Result(error=op(self._error))  # type: ignore
+        pass
 
+    @abstractmethod
     def and_then(self, op: Callable[[T], "Result[T, E]"]) -> "Result[T, E]":
         """Chain operations that might fail."""
-        if not self._has_value:
-            return Result(error=self._error)
-        return op(self._value)  # type: ignore
+        pass
 
+    @abstractmethod
     def or_else(self, op: Callable[[E], "Result[T, E]"]) -> "Result[T, E]":
         """Chain error handling operations."""
-        if self._has_value:
-            return Result(value=self._value)
-        return op(self._error)  # type: ignore
+        pass
+
+
+class Ok(Result[T, E]):
+    """A successful Result holding a value."""
+
+    __slots__ = ("_value",)
+    __match_args__ = ("_value",)
+
+    def __new__(cls, value: T) -> "Ok[T, E]":
+        """Create an Ok holding its success value."""
+        self = object.__new__(cls)
+        self._value = value
+        return self
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_err(self) -> bool:
+        return False
+
+    def unwrap(self) -> T:
+        return self._value
+
+    def unwrap_err(self) -> E:
+        raise ResultError("Called unwrap_err on Ok value: ", self._value)
+
+    def unwrap_or(self, default: T) -> T:
+        return self._value
+
+    def unwrap_or_else(self, op: Callable[[E], T]) -> T:
+        return self._value
+
+    def expect(self, msg: str) -> T:
+        return self._value
+
+    def expect_err(self, msg: str) -> E:
+        raise ResultError(f"{msg}: ", self._value)
+
+    def map(self, op: Callable[[T], T]) -> "Result[T, E]":
+        return Ok(op(self._value))
+
+    def map_err(self, op: Callable[[E], E]) -> "Result[T, E]":
+        return self
+
+    def and_then(self, op: Callable[[T], "Result[T, E]"]) -> "Result[T, E]":
+        return op(self._value)
+
+    def or_else(self, op: Callable[[E], "Result[T, E]"]) -> "Result[T, E]":
+        return self
 
     def __str__(self) -> str:
         """Get a string representation of the Result."""
-        if not self._has_value:
-            return f"Err({self._error})"
         return f"Ok({self._value})"
 
     def __repr__(self) -> str:
         """Get a detailed string representation of the Result."""
-        if not self._has_value:
-            return f"Result.err({self._error!r})"
         return f"Result.ok({self._value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by payload; an Ok never equals an Err."""
+        if type(other) is Ok:
+            return self._value == other._value
+        return False if isinstance(other, Result) else NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the payload together with the variant."""
+        return hash((Ok, self._value))
+
+
+class Err(Result[T, E]):
+    """A failed Result holding an error."""
+
+    __slots__ = ("_error",)
+    __match_args__ = ("_error",)
+
+    def __new__(cls, error: E) -> "Err[T, E]":
+        """Create an Err holding its error value."""
+        self = object.__new__(cls)
+        self._error = error
+        return self
+
+    @classmethod
+    def cached(cls, error: E) -> "Err[Any, E]":
+        """
+        Get a shared Err for a hashable error, creating it on first use.
+
+        Args:
+            error: The error value; must be hashable.
+
+        Returns:
+            The same Err instance for every call with an equal error.
+        """
+        # The error's type is part of the key so that 1 and True stay distinct
+        key = (cls, type(error), error)
+        result = _ERR_CACHE.get(key)
+        if result is None:
+            if len(_ERR_CACHE) >= _ERR_CACHE_SIZE:
+                _ERR_CACHE.clear()
+            result = _ERR_CACHE[key] = cls(error)
+        return result
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_err(self) -> bool:
+        return True
+
+    def unwrap(self) -> T:
+        raise ResultError("", self._error)
+
+    def unwrap_err(self) -> E:
+        return self._error
+
+    def unwrap_or(self, default: T) -> T:
+        return default
+
+    def unwrap_or_else(self, op: Callable[[E], T]) -> T:
+        return op(self._error)
+
+    def expect(self, msg: str) -> T:
+        raise ResultError(f"{msg}: ", self._error)
+
+    def expect_err(self, msg: str) -> E:
+        return self._error
+
+    def map(self, op: Callable[[T], T]) -> "Result[T, E]":
+        return self
+
+    def map_err(self, op: Callable[[E], E]) -> "Result[T, E]":
+        return Err(op(self._error))
+
+    def and_then(self, op: Callable[[T], "Result[T, E]"]) -> "Result[T, E]":
+        return self
+
+    def or_else(self, op: Callable[[E], "Result[T, E]"]) -> "Result[T, E]":
+        return op(self._error)
+
+    def __str__(self) -> str:
+        """Get a string representation of the Result."""
+        return f"Err({self._error})"
+
+    def __repr__(self) -> str:
+        """Get a detailed string representation of the Result."""
+        return f"Result.err({self._error!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by payload; an Ok never equals an Err."""
+        if type(other) is Err:
+            return self._error == other._error
+        return False if isinstance(other, Result) else NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the payload together with the variant."""
+        return hash((Err, self._error))
+
+
+# The subclasses double as the constructors, avoiding a wrapper call
+Result.ok = Ok
+Result.err = Err
@@ -5,7 +5,7 @@ This module demonstrates the use of generics in Python by implementing
 a type-safe stack data structure.
 """
 
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, get_args
 from collections.abc import Iterator
 
 
@@ -52,9 +52,12 @@ class Stack(Generic[T]):
         Raises:
             IndexError: If the stack is empty.
         """
-        if not self._items:
-            raise IndexError("Pop from empty stack")
-        return self._items.pop()
+        # Popping a non-empty stack is the common case, so let list.pop
+        # detect the empty one instead of checking first
+        try:
+            return self._items.pop()
+        except IndexError:
+            raise IndexError("Pop from empty stack") from None
 
     def peek(self) -> Optional[T]:
         """
@@ -94,6 +97,15 @@ class Stack(Generic[T]):
         """
         return reversed(self._items)
 
+    def __reversed__(self) -> Iterator[T]:
+        """
+        Return an iterator over the stack's items (from bottom to top).
+
+        Returns:
+            An iterator over the stack's items in push order.
+        """
+        return iter(self._items)
+
     def __len__(self) -> int:
         """
         Get the number of items in the stack.
@@ -119,9 +131,138 @@ class Stack(Generic[T]):
         Returns:
             A detailed string representation of the stack.
         """
-        type_name = self._items.__class__.__name__
-        if type_name == "list":
-            # Get the type argument from the first item if available
-            if self._items:
-                type_name = self._items[0].__class__.__name__
+        # Stack[int]() records its type argument in __orig_class__
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            (item_type,) = get_args(orig_class)
+            if isinstance(item_type, type):
+                type_name = item_type.__name__
+            else:
+                type_name = repr(item_type)
+        elif self._items:
+            # Otherwise infer it from the first item if available
+            type_name = self._items[0].__class__.__name__
+        else:
+            return f"Stack({self._items})"
         return f"Stack[{type_name}]({self._items})"
+
+
+class BoolStack:
+    """
+    A stack of booleans packed into the bits of a single integer.
+
+    The top of the stack is the lowest bit. Each push or pop shifts the
+    whole integer, so this suits shallow stacks of flags (a few hundred
+    entries) rather than deep ones, where Stack[bool] is the better fit.
+
+    Examples:
+        >>> stack = BoolStack()
+        >>> stack.push(True)
+        >>> stack.push(False)
+        >>> stack.pop()
+        False
+        >>> stack.peek()
+        True
+    """
+
+    __slots__ = ("_bits", "_size")
+
+    def __init__(self) -> None:
+        """Initialize an empty stack."""
+        self._bits = 0
+        self._size = 0
+
+    def push(self, item: bool) -> None:
+        """
+        Push a boolean onto the stack.
+
+        Args:
+            item: The boolean to push onto the stack.
+        """
+        self._bits = (self._bits << 1) | (1 if item else 0)
+        self._size += 1
+
+    def pop(self) -> bool:
+        """
+        Remove and return the top boolean from the stack.
+
+        Returns:
+            The boolean at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self._size:
+            raise IndexError("Pop from empty stack")
+        item = bool(self._bits & 1)
+        self._bits >>= 1
+        self._size -= 1
+        return item
+
+    def peek(self) -> Optional[bool]:
+        """
+        Return the top boolean from the stack without removing it.
+
+        Returns:
+            The boolean at the top of the stack, or None if the stack is empty.
+        """
+        if not self._size:
+            return None
+        return bool(self._bits & 1)
+
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+
+        Returns:
+            True if the stack is empty, False otherwise.
+        """
+        return not self._size
+
+    def size(self) -> int:
+        """
+        Get the number of booleans in the stack.
+
+        Returns:
+            The number of booleans in the stack.
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[bool]:
+        """
+        Return an iterator over the stack's booleans (from top to bottom).
+
+        Returns:
+            An iterator over the stack's booleans.
+        """
+        bits = self._bits
+        for _ in range(self._size):
+            yield bool(bits & 1)
+            bits >>= 1
+
+    def __len__(self) -> int:
+        """
+        Get the number of booleans in the stack.
+
+        Returns:
+            The number of booleans in the stack.
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the stack (bottom to top).
+
+        Returns:
+            A string representation of the stack.
+        """
+        return f"BoolStack({list(self)[::-1]})"
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the stack.
+
+        Returns:
+            A detailed string representation of the stack.
+        """
+        return str(self)
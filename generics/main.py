@@ -5,7 +5,7 @@ Example usage of generic types in Python.
 from dataclasses import dataclass, field
 from typing import List
 from generics.stack import Stack
-from generics.result import Result
+from generics.result import Result, Ok, Err
 from generics.repository import Repository, InMemoryRepository
 
 
@@ -52,7 +52,7 @@ def demonstrate_result() -> None:
 
     def divide(a: float, b: float) -> Result[float, str]:
         if b == 0:
-            return Result.err("division by zero")
+            return Err.cached("division by zero")
         return Result.ok(a / b)
 
     result1 = divide(10, 2)
@@ -81,7 +81,8 @@ def demonstrate_result() -> None:
     result = parse_int("not a number").and_then(double)
     print(f"Error processing not a number: {result.unwrap_err()}")
 
-    result = parse_int("21").and_then(double)
+    # pipeline runs the same chain as one loop over the operations
+    result = Result.pipeline("21", parse_int, double)
     print(f"Double of 21: {result.unwrap()}")
 
     # Example 3: Mapping and defaults
@@ -121,45 +122,43 @@ def demonstrate_repository() -> None:
 
     # Create
     user = User(_id="1", name="John Doe", email="john@example.com")
-    result = user_repo.save(user)
-    if result.is_ok():
-        print(f"Created user: {result.unwrap()}")
+    match user_repo.save(user):
+        case Ok(created):
+            print(f"Created user: {created}")
 
     # Read
-    result = user_repo.find_by_id("1")
-    if result.is_ok():
-        print(f"Found user: {result.unwrap()}")
+    match user_repo.find_by_id("1"):
+        case Ok(found):
+            print(f"Found user: {found}")
 
     # Update (in our simple implementation, this is a save)
     updated_user = User(_id="1", name="John Doe", email="john.doe@example.com")
     user_repo.delete("1")  # Delete first since our implementation doesn't update
-    result = user_repo.save(updated_user)
-    if result.is_ok():
-        print(f"Updated user: {result.unwrap()}")
+    match user_repo.save(updated_user):
+        case Ok(updated):
+            print(f"Updated user: {updated}")
 
     # Delete
-    result = user_repo.delete("1")
-    if result.is_ok():
-        print("Deleted user successfully")
+    match user_repo.delete("1"):
+        case Ok():
+            print("Deleted user successfully")
 
     # Example 2: Error handling
     print("\nError handling:")
 
     # Try to find non-existent user
-    result = user_repo.find_by_id("999")
-    if result.is_err():
-        error = result.unwrap_err()
-        print(f"Error finding user: {error.message} (Code: {error.code})")
+    match user_repo.find_by_id("999"):
+        case Err(error):
+            print(f"Error finding user: {error.message} (Code: {error.code})")
 
     # Try to save duplicate user
     user1 = User(_id="2", name="Jane Doe", email="jane@example.com")
     user2 = User(_id="2", name="Different Name", email="different@example.com")
 
     user_repo.save(user1)
-    result = user_repo.save(user2)
-    if result.is_err():
-        error = result.unwrap_err()
-        print(f"Error saving duplicate user: {error.message} (Code: {error.code})")
+    match user_repo.save(user2):
+        case Err(error):
+            print(f"Error saving duplicate user: {error.message} (Code: {error.code})")
 
     # Example 3: Working with multiple types
     print("\nMultiple entity types:")
@@ -188,14 +187,14 @@ def demonstrate_repository() -> None:
         content="This is my first post",
         author_id="2",
     )
-    result = post_repo.save(post)
-    if result.is_ok():
-        print(f"Created post: {result.unwrap()}")
+    match post_repo.save(post):
+        case Ok(created):
+            print(f"Created post: {created}")
 
     # Find all posts
-    result = post_repo.find_all()
-    if result.is_ok():
-        print("All posts:", result.unwrap())
+    match post_repo.find_all():
+        case Ok(posts):
+            print("All posts:", posts)
 
 
 def main() -> None:
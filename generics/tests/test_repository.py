@@ -2,8 +2,10 @@
 Tests for the generic Repository implementation.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, replace
+from operator import attrgetter
 from uuid import UUID, uuid4
+import pytest
 from generics.repository import (
     Repository,
     InMemoryRepository,
@@ -13,184 +15,224 @@ from generics.repository import (
 from generics.result import Result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """Example user entity with string ID."""
 
-    _id: str = field(repr=False)
+    id: str
     name: str
     email: str
 
-    @property
-    def id(self) -> str:
-        """Get the user's ID."""
-        return self._id
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Post:
     """Example post entity with UUID ID."""
 
-    _id: UUID = field(repr=False)
+    id: UUID
     title: str
     content: str
 
-    @property
-    def id(self) -> UUID:
-        """Get the post's ID."""
-        return self._id
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Counter:
     """Example counter entity with integer ID."""
 
-    _id: int = field(repr=False)
+    id: int
     value: int
 
-    @property
-    def id(self) -> int:
-        """Get the counter's ID."""
-        return self._id
+
+# Results and errors are immutable, so every rejected title shares this one
+TITLE_TOO_SHORT: Result[Post, RepositoryError] = Result.err(
+    RepositoryError(
+        code="VALIDATION_ERROR",
+        message="Title must be at least 3 characters long",
+    )
+)
+
+# Never produced by uuid4(), whose version bits are always set
+MISSING_UUID = UUID(int=0)
+
+# Sort key for comparing entity lists in ID order
+by_id = attrgetter("id")
+
+# Repository types for the entities above, subscripted once per module
+UserRepository = InMemoryRepository[User, str]
+PostRepository = InMemoryRepository[Post, UUID]
+CounterRepository = InMemoryRepository[Counter, int]
+
+
+@pytest.fixture
+def user_repo() -> Repository[User, str]:
+    """Provide an empty repository of users."""
+    return UserRepository()
+
+
+@pytest.fixture
+def post_repo() -> Repository[Post, UUID]:
+    """Provide an empty repository of posts."""
+    return PostRepository()
 
 
-def test_repository_with_string_id() -> None:
+@pytest.fixture
+def counter_repo() -> Repository[Counter, int]:
+    """Provide an empty repository of counters."""
+    return CounterRepository()
+
+
+def test_repository_with_string_id(user_repo: Repository[User, str]) -> None:
     """Test repository operations with string IDs."""
-    repo: Repository[User, str] = InMemoryRepository[User, str]()
-    user = User(_id="user-1", name="John Doe", email="john@example.com")
+    user = User(id="user-1", name="John Doe", email="john@example.com")
 
     # Save
-    result = repo.save(user)
+    result = user_repo.save(user)
     assert result.is_ok()
     assert result.unwrap() == user
 
     # Find
-    result = repo.find_by_id("user-1")
+    result = user_repo.find_by_id("user-1")
     assert result.is_ok()
     assert result.unwrap() == user
 
     # Delete
-    result = repo.delete("user-1")
+    result = user_repo.delete("user-1")
     assert result.is_ok()
     assert result.unwrap() == Unit()
 
 
-def test_repository_with_uuid() -> None:
+def test_repository_with_uuid(post_repo: Repository[Post, UUID]) -> None:
     """Test repository operations with UUID IDs."""
-    repo: Repository[Post, UUID] = InMemoryRepository[Post, UUID]()
     post_id = uuid4()
-    post = Post(_id=post_id, title="Hello", content="World")
+    post = Post(id=post_id, title="Hello", content="World")
 
     # Save
-    result = repo.save(post)
+    result = post_repo.save(post)
     assert result.is_ok()
     assert result.unwrap() == post
 
     # Find
-    result = repo.find_by_id(post_id)
+    result = post_repo.find_by_id(post_id)
     assert result.is_ok()
     assert result.unwrap() == post
 
     # Not found with different UUID
-    result = repo.find_by_id(uuid4())
+    result = post_repo.find_by_id(MISSING_UUID)
     assert result.is_err()
     assert result.unwrap_err().code == "NOT_FOUND"
 
 
-def test_repository_with_int_id() -> None:
+def test_repository_with_int_id(counter_repo: Repository[Counter, int]) -> None:
     """Test repository operations with integer IDs."""
-    repo: Repository[Counter, int] = InMemoryRepository[Counter, int]()
-    counter = Counter(_id=1, value=42)
+    counter = Counter(id=1, value=42)
 
     # Save
-    result = repo.save(counter)
+    result = counter_repo.save(counter)
     assert result.is_ok()
     assert result.unwrap() == counter
 
     # Find
-    result = repo.find_by_id(1)
+    result = counter_repo.find_by_id(1)
     assert result.is_ok()
     assert result.unwrap() == counter
 
     # Update value
-    new_counter = Counter(_id=1, value=43)
-    repo.delete(1)
-    result = repo.save(new_counter)
+    new_counter = replace(counter, value=43)
+    counter_repo.delete(1)
+    result = counter_repo.save(new_counter)
     assert result.is_ok()
     assert result.unwrap().value == 43
 
 
-def test_repository_find_all() -> None:
+def test_repository_find_all(user_repo: Repository[User, str]) -> None:
     """Test finding all entities."""
-    repo: Repository[User, str] = InMemoryRepository[User, str]()
     users = [
-        User(_id="1", name="John Doe", email="john@example.com"),
-        User(_id="2", name="Jane Doe", email="jane@example.com"),
+        User(id="1", name="John Doe", email="john@example.com"),
+        User(id="2", name="Jane Doe", email="jane@example.com"),
     ]
 
-    for user in users:
-        repo.save(user)
+    result = user_repo.save_many(users)
+    assert result.is_ok()
+    assert result.unwrap() == users
+
+    result = user_repo.find_all()
+    assert result.is_ok()
+    # users is in ID order; sorting avoids hashing every entity field
+    assert sorted(result.unwrap(), key=by_id) == users
 
-    result = repo.find_all()
+    result = user_repo.find_all_iter()
     assert result.is_ok()
-    assert set(result.unwrap()) == set(users)
+    view = result.unwrap()
+    assert sorted(view, key=by_id) == users
 
+    # The view tracks later changes to the repository
+    user_repo.delete("1")
+    assert list(view) == [users[1]]
 
-def test_repository_error_messages() -> None:
-    """Test error messages from the repository."""
-    repo: Repository[User, str] = InMemoryRepository[User, str]()
 
+def test_repository_save_many_rejects_duplicates(
+    user_repo: Repository[User, str],
+) -> None:
+    """Test that a batch with a known or repeated ID saves nothing."""
+    john = User(id="1", name="John Doe", email="john@example.com")
+    jane = User(id="2", name="Jane Doe", email="jane@example.com")
+    user_repo.save(john)
+
+    result = user_repo.save_many([jane, john])
+    assert result.is_err()
+    assert result.unwrap_err().code == "ALREADY_EXISTS"
+
+    result = user_repo.save_many([jane, replace(jane, name="Jane Smith")])
+    assert result.is_err()
+    assert "'2'" in result.unwrap_err().message
+
+    assert user_repo.find_all().unwrap() == [john]
+
+
+def test_repository_error_messages(user_repo: Repository[User, str]) -> None:
+    """Test error messages from the repository."""
     # Test not found error
-    result = repo.find_by_id("999")
+    result = user_repo.find_by_id("999")
     assert result.is_err()
     error = result.unwrap_err()
     assert error.code == "NOT_FOUND"
     assert "999" in error.message
 
     # Test already exists error
-    user = User(_id="1", name="John Doe", email="john@example.com")
-    repo.save(user)
-    result = repo.save(user)
+    user = User(id="1", name="John Doe", email="john@example.com")
+    user_repo.save(user)
+    result = user_repo.save(user)
     assert result.is_err()
     error = result.unwrap_err()
     assert error.code == "ALREADY_EXISTS"
     assert "1" in error.message
 
 
-def test_practical_example() -> None:
+def test_practical_example(post_repo: Repository[Post, UUID]) -> None:
     """Test a practical example using the repository."""
-    # Use UUID for post IDs
-    repo: Repository[Post, UUID] = InMemoryRepository[Post, UUID]()
 
     def create_post(title: str, content: str) -> Result[Post, RepositoryError]:
         """Create a new post with validation."""
         if len(title) < 3:
-            return Result.err(
-                RepositoryError(
-                    code="VALIDATION_ERROR",
-                    message="Title must be at least 3 characters long",
-                )
-            )
+            return TITLE_TOO_SHORT
 
-        post = Post(_id=uuid4(), title=title, content=content)
-        return repo.save(post)
+        post = Post(id=uuid4(), title=title, content=content)
+        return post_repo.save(post)
 
     def update_content(
         post_id: UUID, new_content: str
     ) -> Result[Post, RepositoryError]:
         """Update a post's content."""
         # Find post
-        post_result = repo.find_by_id(post_id)
+        post_result = post_repo.find_by_id(post_id)
         if post_result.is_err():
             return post_result
 
         # Update and save
         post = post_result.unwrap()
-        updated_post = Post(_id=post.id, title=post.title, content=new_content)
-        delete_result = repo.delete(post_id)
+        updated_post = Post(id=post.id, title=post.title, content=new_content)
+        delete_result = post_repo.delete(post_id)
         if delete_result.is_err():
             return Result.err(delete_result.unwrap_err())
-        return repo.save(updated_post)
+        return post_repo.save(updated_post)
 
     # Test post creation
     result = create_post("Hello World", "Initial content")
@@ -210,7 +252,71 @@ def test_practical_example() -> None:
     assert updated_post.content == "Updated content"
 
     # Test update with invalid ID
-    result = update_content(uuid4(), "This should fail")
+    result = update_content(MISSING_UUID, "This should fail")
     assert result.is_err()
     error = result.unwrap_err()
     assert error.code == "NOT_FOUND"
+
+
+def test_repository_delete_shares_ok_unit(
+    counter_repo: Repository[Counter, int],
+) -> None:
+    """Test that successful deletes return one shared Ok(Unit) result."""
+    counter_repo.save(Counter(id=1, value=1))
+    counter_repo.save(Counter(id=2, value=2))
+
+    first = counter_repo.delete(1)
+    second = counter_repo.delete(2)
+    assert first is second
+    assert first.unwrap() == Unit()
+    assert hash(Unit()) == hash(first.unwrap())
+
+
+def test_repository_finds_falsy_entity() -> None:
+    """Test that an entity which is falsy is still found by its ID."""
+
+    @dataclass(frozen=True, slots=True)
+    class Empty:
+        id: int
+
+        def __bool__(self) -> bool:
+            return False
+
+    repo: Repository[Empty, int] = InMemoryRepository[Empty, int]()
+    entity = Empty(id=0)
+    repo.save(entity)
+
+    result = repo.find_by_id(0)
+    assert result.is_ok()
+    assert result.unwrap() is entity
+
+
+def test_repository_error_is_cached(user_repo: Repository[User, str]) -> None:
+    """Test that repeated misses share one frozen error instance."""
+
+    first = user_repo.find_by_id("missing").unwrap_err()
+    second = user_repo.delete("missing").unwrap_err()
+    assert first is second
+    assert RepositoryError.not_found(1) is not RepositoryError.not_found(True)
+    with pytest.raises(FrozenInstanceError):
+        first.message = "changed"  # type: ignore[misc]
+
+
+def test_unit_is_singleton() -> None:
+    """Test that every Unit() is the same object."""
+    assert Unit() is Unit()
+    assert Unit() == Unit()
+    assert Unit() != object()
+    assert len({Unit(), Unit()}) == 1
+
+
+def test_unit_subclass_has_its_own_instance() -> None:
+    """Test that a Unit subclass is a singleton of its own type."""
+
+    class Done(Unit):
+        __slots__ = ()
+
+    assert type(Done()) is Done
+    assert Done() is Done()
+    assert Done() != Unit()
+    assert type(Unit()) is Unit
@@ -2,155 +2,168 @@
 Tests for the generic Result type.
 """
 
-import unittest
+import re
+from typing import Callable
 import pytest
-from generics.result import Result
-
-
-class TestResult(unittest.TestCase):
-    """Test cases for the Result type."""
-
-    def test_ok_result(self) -> None:
-        """Test creating and using Ok results."""
-        # Test creating an Ok result
-        result = Result.ok(42)
-        self.assertTrue(result.is_ok())
-        self.assertFalse(result.is_err())
-        self.assertEqual(result.unwrap(), 42)
-
-    def test_err_result(self) -> None:
-        """Test creating and using Err results."""
-        # Test creating an Err result
-        result = Result.err("error")
-        self.assertFalse(result.is_ok())
-        self.assertTrue(result.is_err())
-        self.assertEqual(result.unwrap_err(), "error")
-
-    def test_unwrap_or(self) -> None:
-        """Test unwrap_or with default values."""
-        # Test unwrap_or with Ok result
-        ok_result = Result.ok(42)
-        self.assertEqual(ok_result.unwrap_or(0), 42)
-
-        # Test unwrap_or with Err result
-        err_result = Result.err("error")
-        self.assertEqual(err_result.unwrap_or(0), 0)
-
-    def test_map(self) -> None:
-        """Test mapping over results."""
-        # Test mapping over Ok result
-        ok_result = Result.ok(2)
-        mapped_ok = ok_result.map(lambda x: x * 2)
-        self.assertTrue(mapped_ok.is_ok())
-        self.assertEqual(mapped_ok.unwrap(), 4)
-
-        # Test mapping over Err result
-        err_result = Result.err("error")
-        mapped_err = err_result.map(lambda x: x * 2)
-        self.assertTrue(mapped_err.is_err())
-        self.assertEqual(mapped_err.unwrap_err(), "error")
-
-    def test_and_then(self) -> None:
-        """Test chaining operations with and_then."""
-
-        def safe_divide(x: float, y: float) -> Result[float, str]:
-            if y == 0:
-                return Result.err("division by zero")
-            return Result.ok(x / y)
-
-        # Test successful chain
-        result = Result.ok(10).and_then(lambda x: safe_divide(x, 2))
-        self.assertTrue(result.is_ok())
-        self.assertEqual(result.unwrap(), 5.0)
-
-        # Test failed chain
-        result = Result.ok(10).and_then(lambda x: safe_divide(x, 0))
-        self.assertTrue(result.is_err())
-        self.assertEqual(result.unwrap_err(), "division by zero")
-
-        # Test chain with initial error
-        result = Result.err("initial error").and_then(lambda x: safe_divide(x, 2))
-        self.assertTrue(result.is_err())
-        self.assertEqual(result.unwrap_err(), "initial error")
-
-    def test_or_else(self) -> None:
-        """Test error handling with or_else."""
-
-        def handle_error(err: str) -> Result[int, str]:
-            if "retry" in err:
-                return Result.ok(42)
-            return Result.err(f"unhandled: {err}")
-
-        # Test successful recovery
-        result = Result.err("please retry").or_else(handle_error)
-        self.assertTrue(result.is_ok())
-        self.assertEqual(result.unwrap(), 42)
-
-        # Test failed recovery
-        result = Result.err("fatal error").or_else(handle_error)
-        self.assertTrue(result.is_err())
-        self.assertEqual(result.unwrap_err(), "unhandled: fatal error")
-
-        # Test or_else with Ok result
-        result = Result.ok(123).or_else(handle_error)
-        self.assertTrue(result.is_ok())
-        self.assertEqual(result.unwrap(), 123)
-
-    def test_unwrap_raises(self) -> None:
-        """Test that unwrap raises on Err results."""
-        with self.assertRaises(ValueError) as context:
-            Result.err("error").unwrap()
-        self.assertEqual(str(context.exception), "error")
-
-    def test_unwrap_err_raises(self) -> None:
-        """Test that unwrap_err raises on Ok results."""
-        with self.assertRaises(ValueError) as context:
-            Result.ok(42).unwrap_err()
-        self.assertEqual(str(context.exception), "Called unwrap_err on Ok value: 42")
-
-    def test_map_err(self) -> None:
-        """Test mapping over error values."""
-
-        def add_context(err: str) -> str:
-            return f"Error: {err}"
-
-        # Test mapping over Err result
-        result = Result.err("not found").map_err(add_context)
-        self.assertTrue(result.is_err())
-        self.assertEqual(result.unwrap_err(), "Error: not found")
-
-        # Test mapping over Ok result
-        result = Result.ok(42).map_err(add_context)
-        self.assertTrue(result.is_ok())
-        self.assertEqual(result.unwrap(), 42)
-
-    def test_practical_example(self) -> None:
-        """Test a practical example using Result."""
-
-        def parse_int(s: str) -> Result[int, str]:
-            try:
-                return Result.ok(int(s))
-            except ValueError:
-                return Result.err(f"could not parse '{s}' as integer")
-
-        def double(n: int) -> Result[int, str]:
-            return Result.ok(n * 2)
-
-        # Test successful chain
-        result = parse_int("42").and_then(double)
-        self.assertTrue(result.is_ok())
-        self.assertEqual(result.unwrap(), 84)
-
-        # Test failed parse
-        result = parse_int("not a number").and_then(double)
-        self.assertTrue(result.is_err())
-        self.assertEqual(
-            result.unwrap_err(), "could not parse 'not a number' as integer"
-        )
-
-
-if __name__ == "__main__":
-    unittest.main()
+from generics.result import Result, Ok, Err, ResultError
+
+
+# Operations shared by the tests below, defined once instead of per test
+def times_two(x: int) -> int:
+    return x * 2
+
+
+def safe_divide(x: float, y: float) -> Result[float, str]:
+    if y == 0:
+        return Result.err("division by zero")
+    return Result.ok(x / y)
+
+
+def halve(x: float) -> Result[float, str]:
+    return safe_divide(x, 2)
+
+
+def divide_by_zero(x: float) -> Result[float, str]:
+    return safe_divide(x, 0)
+
+
+def parse_int(s: str) -> Result[int, str]:
+    try:
+        return Result.ok(int(s))
+    except ValueError:
+        return Result.err(f"could not parse '{s}' as integer")
+
+
+def double(n: int) -> Result[int, str]:
+    return Result.ok(n * 2)
+
+
+def recover_with_zero(err: str) -> Result[int, str]:
+    return Result.ok(0)
+
+
+def retry_on_request(err: str) -> Result[int, str]:
+    if "retry" in err:
+        return Result.ok(42)
+    return Result.err(f"unhandled: {err}")
+
+
+def add_context(err: str) -> str:
+    return f"Error: {err}"
+
+
+def exact(message: str) -> str:
+    """Build a pytest.raises pattern matching only this exact message."""
+    return f"^{re.escape(message)}$"
+
+
+def test_ok_result() -> None:
+    """Test creating and using Ok results."""
+    result = Result.ok(42)
+    assert result.is_ok()
+    assert not result.is_err()
+    assert result.unwrap() == 42
+
+
+def test_err_result() -> None:
+    """Test creating and using Err results."""
+    result = Result.err("error")
+    assert not result.is_ok()
+    assert result.is_err()
+    assert result.unwrap_err() == "error"
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [(Result.ok(42), 42), (Result.err("error"), 0)],
+    ids=["ok", "err"],
+)
+def test_unwrap_or(result: Result[int, str], expected: int) -> None:
+    """Test unwrap_or with default values."""
+    assert result.unwrap_or(0) == expected
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [(Result.ok(2), Result.ok(4)), (Result.err("error"), Result.err("error"))],
+    ids=["ok", "err"],
+)
+def test_map(result: Result[int, str], expected: Result[int, str]) -> None:
+    """Test mapping over results."""
+    assert result.map(times_two) == expected
+
+
+@pytest.mark.parametrize(
+    "result, op, expected",
+    [
+        (Result.ok(10), halve, Result.ok(5.0)),
+        (Result.ok(10), divide_by_zero, Result.err("division by zero")),
+        (Result.err("initial error"), halve, Result.err("initial error")),
+    ],
+    ids=["success", "failure", "initial-error"],
+)
+def test_and_then(
+    result: Result[float, str],
+    op: Callable[[float], Result[float, str]],
+    expected: Result[float, str],
+) -> None:
+    """Test chaining operations with and_then."""
+    assert result.and_then(op) == expected
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        (Result.err("please retry"), Result.ok(42)),
+        (Result.err("fatal error"), Result.err("unhandled: fatal error")),
+        (Result.ok(123), Result.ok(123)),
+    ],
+    ids=["recovered", "unrecovered", "ok"],
+)
+def test_or_else(result: Result[int, str], expected: Result[int, str]) -> None:
+    """Test error handling with or_else."""
+    assert result.or_else(retry_on_request) == expected
+
+
+def test_unwrap_raises() -> None:
+    """Test that unwrap raises on Err results."""
+    with pytest.raises(ValueError, match=exact("error")):
+        Result.err("error").unwrap()
+
+
+def test_unwrap_err_raises() -> None:
+    """Test that unwrap_err raises on Ok results."""
+    with pytest.raises(ValueError, match=exact("Called unwrap_err on Ok value: 42")):
+        Result.ok(42).unwrap_err()
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        (Result.err("not found"), Result.err("Error: not found")),
+        (Result.ok(42), Result.ok(42)),
+    ],
+    ids=["err", "ok"],
+)
+def test_map_err(result: Result[int, str], expected: Result[int, str]) -> None:
+    """Test mapping over error values."""
+    assert result.map_err(add_context) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("42", Result.ok(84)),
+        (
+            "not a number",
+            Result.err("could not parse 'not a number' as integer"),
+        ),
+    ],
+    ids=["parsed", "unparsable"],
+)
+def test_practical_example(text: str, expected: Result[int, str]) -> None:
+    """Test a practical example using Result."""
+    assert parse_int(text).and_then(double) == expected
 
 
 def test_result_invalid_creation() -> None:
@@ -162,28 +175,14 @@ def test_result_invalid_creation() -> None:
         Result()
 
 
-def test_result_unwrap() -> None:
-    """Test unwrapping Result values."""
-    # Unwrap ok
-    ok_result = Result.ok(42)
-    assert ok_result.unwrap() == 42
-
-    # Unwrap error should raise
-    err_result = Result.err("error")
-    with pytest.raises(ValueError):
-        err_result.unwrap()
-
-
-def test_result_unwrap_err() -> None:
-    """Test unwrapping Result errors."""
-    # Unwrap error
-    err_result = Result.err("error")
-    assert err_result.unwrap_err() == "error"
-
-    # Unwrap ok should raise
-    ok_result = Result.ok(42)
-    with pytest.raises(ValueError):
-        ok_result.unwrap_err()
+def test_result_none_payload() -> None:
+    """Test that None is a valid success or error value."""
+    assert Result.ok(None).is_ok()
+    assert Result.ok(None).unwrap() is None
+    assert Result.err(None).is_err()
+    assert Result.err(None).unwrap_err() is None
+    assert Result(value=None).is_ok()
+    assert Result(error=None).is_err()
 
 
 def test_result_unwrap_or_else() -> None:
@@ -200,49 +199,110 @@ def test_result_expect() -> None:
     """Test expect with custom messages."""
     assert Result.ok(42).expect("should be ok") == 42
 
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match=exact("custom message: error")):
         Result.err("error").expect("custom message")
-    assert str(exc_info.value) == "custom message: error"
 
 
 def test_result_expect_err() -> None:
     """Test expect_err with custom messages."""
     assert Result.err("error").expect_err("should be error") == "error"
 
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match=exact("custom message: 42")):
         Result.ok(42).expect_err("custom message")
-    assert str(exc_info.value) == "custom message: 42"
 
 
-def test_result_map_err() -> None:
-    """Test mapping over Result errors."""
+def test_result_uses_slots() -> None:
+    """Test that Result stores a single payload without a __dict__."""
+    assert not hasattr(Result.ok(42), "__dict__")
+    assert not hasattr(Result.err("error"), "__dict__")
 
-    def add_context(error: str) -> str:
-        return f"Error occurred: {error}"
 
-    assert (
-        Result.err("bad input").map_err(add_context).unwrap_err()
-        == "Error occurred: bad input"
-    )
-    assert Result.ok(42).map_err(add_context).unwrap() == 42
+def test_result_variants() -> None:
+    """Test that Results are Ok or Err instances."""
+    assert isinstance(Result.ok(42), Ok)
+    assert isinstance(Result.err("error"), Err)
+    assert isinstance(Result(value=42), Ok)
+    assert isinstance(Result(error="error"), Err)
+    assert isinstance(Ok(42), Result)
+    assert Err("error").unwrap_err() == "error"
 
 
-def test_practical_example() -> None:
-    """Test a practical example using Result."""
+def test_result_subclass_must_implement_interface() -> None:
+    """Test that a Result subclass missing methods cannot be instantiated."""
 
-    def parse_number(s: str) -> Result[int, str]:
-        try:
-            return Result.ok(int(s))
-        except ValueError:
-            return Result.err(f"could not parse '{s}' as integer")
+    class Partial(Result[int, str]):
+        def is_ok(self) -> bool:
+            return True
 
-    def double(x: int) -> Result[int, str]:
-        return Result.ok(x * 2)
+    with pytest.raises(TypeError, match="abstract"):
+        Partial()
+
+
+def test_untouched_results_are_returned_as_is() -> None:
+    """Test that operations for the other outcome return the same Result."""
+    ok_result = Result.ok(42)
+    assert ok_result.map_err(str.upper) is ok_result
+    assert ok_result.or_else(recover_with_zero) is ok_result
+
+    err_result = Result.err("error")
+    assert err_result.map(times_two) is err_result
+    assert err_result.and_then(double) is err_result
+
+
+def test_err_cached() -> None:
+    """Test that cached errors share one Err per distinct error value."""
+    first = Err.cached("division by zero")
+    assert first is Err.cached("division by zero")
+    assert first.unwrap_err() == "division by zero"
+    assert Err.cached(1) is not Err.cached(True)
+
+
+def test_result_pipeline() -> None:
+    """Test running a chain of fallible operations with pipeline."""
+
+    assert Result.pipeline("21", parse_int, double, double).unwrap() == 84
+    assert Result.pipeline(5).unwrap() == 5
+
+    calls = []
+
+    def record(n: int) -> Result[int, str]:
+        calls.append(n)
+        return Result.ok(n)
+
+    result = Result.pipeline("abc", parse_int, record)
+    assert result.unwrap_err() == "could not parse 'abc' as integer"
+    assert calls == []
+
+
+def test_result_pattern_matching() -> None:
+    """Test destructuring Ok and Err with a match statement."""
+
+    def describe(result: Result[int, str]) -> str:
+        match result:
+            case Ok(value):
+                return f"value {value}"
+            case Err(error):
+                return f"error {error}"
+        return "unreachable"
+
+    assert describe(Result.ok(42)) == "value 42"
+    assert describe(Result.err("boom")) == "error boom"
+
+
+def test_result_equality() -> None:
+    """Test that Results compare by variant and payload."""
+    assert Result.ok(42) == Result.ok(42)
+    assert Result.ok(42) != Result.ok(43)
+    assert Result.ok(42) != Result.err(42)
+    assert Result.err("error") == Result.err("error")
+    assert Result.ok(42) != 42
+    assert len({Result.ok(1), Result.ok(1), Result.err(1)}) == 2
 
-    # Successful chain
-    result = parse_number("21").and_then(double)
-    assert result.unwrap() == 42
 
-    # Error chain
-    result = parse_number("not a number").and_then(double)
-    assert result.unwrap_err() == "could not parse 'not a number' as integer"
+def test_result_error_keeps_payload() -> None:
+    """Test that unwrap failures raise ResultError carrying the payload."""
+    payload = {"code": 404}
+    with pytest.raises(ResultError, match=exact("{'code': 404}")) as exc_info:
+        Result.err(payload).unwrap()
+    assert exc_info.value.payload is payload
+    assert isinstance(exc_info.value, ValueError)
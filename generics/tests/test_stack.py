@@ -2,9 +2,19 @@
 Tests for the generic Stack implementation.
 """
 
+import copy
 import pytest
 from typing import List
-from generics.stack import Stack
+from generics.stack import Stack, BoolStack
+
+# Stack type shared by the integer tests, subscripted once per module
+IntStack = Stack[int]
+
+
+@pytest.fixture
+def int_stack() -> Stack[int]:
+    """Provide an empty stack of integers."""
+    return IntStack()
 
 
 def test_stack_creation() -> None:
@@ -25,24 +35,22 @@ def test_stack_creation() -> None:
     assert len(stack_list) == 0
 
 
-def test_stack_push_pop() -> None:
+def test_stack_push_pop(int_stack: Stack[int]) -> None:
     """Test pushing and popping items."""
-    stack = Stack[int]()
-
     # Push items
-    stack.push(1)
-    assert not stack.is_empty()
-    assert len(stack) == 1
+    int_stack.push(1)
+    assert not int_stack.is_empty()
+    assert len(int_stack) == 1
 
-    stack.push(2)
-    assert len(stack) == 2
+    int_stack.push(2)
+    assert len(int_stack) == 2
 
     # Pop items
-    assert stack.pop() == 2
-    assert len(stack) == 1
+    assert int_stack.pop() == 2
+    assert len(int_stack) == 1
 
-    assert stack.pop() == 1
-    assert stack.is_empty()
+    assert int_stack.pop() == 1
+    assert int_stack.is_empty()
 
 
 def test_stack_peek() -> None:
@@ -63,25 +71,37 @@ def test_stack_peek() -> None:
     assert len(stack) == 2
 
 
-def test_stack_iteration() -> None:
+def test_stack_iteration(int_stack: Stack[int]) -> None:
     """Test iterating over stack items."""
-    stack = Stack[int]()
     items = [1, 2, 3, 4, 5]
 
     # Push items
     for item in items:
-        stack.push(item)
+        int_stack.push(item)
 
     # Verify iteration (should be in reverse order)
-    assert list(stack) == list(reversed(items))
+    for got, want in zip(int_stack, reversed(items), strict=True):
+        assert got == want
+
+    # Reversed iteration runs from bottom to top
+    for got, want in zip(reversed(int_stack), items, strict=True):
+        assert got == want
 
 
-def test_stack_empty_pop() -> None:
+def test_stack_empty_pop(int_stack: Stack[int]) -> None:
     """Test popping from an empty stack raises IndexError."""
-    stack = Stack[int]()
+    with pytest.raises(IndexError, match="^Pop from empty stack$"):
+        int_stack.pop()
 
-    with pytest.raises(IndexError):
-        stack.pop()
+
+def test_stack_copy_is_independent(int_stack: Stack[int]) -> None:
+    """Test that a deep copy does not share storage with the original."""
+    int_stack.push(1)
+    copied = copy.deepcopy(int_stack)
+    copied.push(2)
+
+    assert list(int_stack) == [1]
+    assert list(copied) == [2, 1]
 
 
 def test_stack_type_safety() -> None:
@@ -106,6 +126,15 @@ def test_stack_str_repr() -> None:
     assert str(stack) == "Stack([1, 2])"
     assert repr(stack) == "Stack[int]([1, 2])"
 
+    # The type argument is used even when the stack is empty or mixed
+    assert repr(Stack[str]()) == "Stack[str]([])"
+    assert repr(Stack[List[int]]()) == "Stack[typing.List[int]]([])"
+    assert repr(Stack()) == "Stack([])"
+
+    untyped = Stack()
+    untyped.push(1.5)
+    assert repr(untyped) == "Stack[float]([1.5])"
+
 
 def test_complex_types() -> None:
     """Test stack with more complex types."""
@@ -121,3 +150,24 @@ def test_complex_types() -> None:
     stack_tuples.push(("answer", 42))
 
     assert stack_tuples.peek() == ("answer", 42)
+
+
+def test_bool_stack() -> None:
+    """Test the bit-packed boolean stack."""
+    stack = BoolStack()
+    assert stack.is_empty()
+    assert stack.peek() is None
+
+    flags = [True, False, False, True, True]
+    for flag in flags:
+        stack.push(flag)
+
+    assert len(stack) == stack.size() == 5
+    assert stack.peek() is True
+    assert list(stack) == list(reversed(flags))
+    assert str(stack) == "BoolStack([True, False, False, True, True])"
+
+    assert [stack.pop() for _ in flags] == list(reversed(flags))
+    assert stack.is_empty()
+    with pytest.raises(IndexError):
+        stack.pop()
@@ -27,9 +27,9 @@ def demonstrate_observer_pattern():
     statistics_display = StatisticsDisplay(weather_station)
     forecast_display = ForecastDisplay(weather_station)
     print(
-        f"Created displays: {current_display.__class__.__name__}, "
-        f"{statistics_display.__class__.__name__}, "
-        f"{forecast_display.__class__.__name__}"
+        f"Created displays: {type(current_display).__name__}, "
+        f"{type(statistics_display).__name__}, "
+        f"{type(forecast_display).__name__}"
     )
 
     print("\n--- Initial Weather Update ---")
@@ -43,7 +43,7 @@ def demonstrate_observer_pattern():
     print("\n--- Adding Heat Index Display ---")
     # Add a new observer at runtime
     heat_index_display = HeatIndexDisplay(weather_station)
-    print(f"Added {heat_index_display.__class__.__name__}")
+    print(f"Added {type(heat_index_display).__name__}")
 
     print("\n--- Third Weather Update (All Displays) ---")
     # Now all four displays will update
@@ -75,13 +75,17 @@ def demonstrate_push_vs_pull():
     current_display = CurrentConditionsDisplay(weather_station)
     statistics_display = StatisticsDisplay(weather_station)
     print(
-        f"Created displays: {current_display.__class__.__name__}, "
-        f"{statistics_display.__class__.__name__}"
+        f"Created displays: {type(current_display).__name__}, "
+        f"{type(statistics_display).__name__}"
     )
 
     print("--- Weather Update (Both Models) ---")
     weather_station.set_measurements(75, 60, 30.1)
 
+    print("\n--- Batched Weather Update (One Notification) ---")
+    # Only the last sample reaches the displays
+    weather_station.set_measurements_batch([(76, 62, 30.0), (74, 58, 30.2)])
+
 
 def main() -> None:
     """Run the weather station demo."""
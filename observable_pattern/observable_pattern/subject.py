@@ -3,7 +3,8 @@ Subject Interface and abstract class definition.
 """
 
 from abc import ABC
-from typing import List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 from .observer import Observer
 
 
@@ -13,8 +14,12 @@ class Subject(ABC):
     """
 
     def __init__(self) -> None:
-        """Initialize an empty list of observers."""
-        self._observers: List[Observer] = []
+        """Initialize an empty tuple of observers."""
+        # Rebuilt on attach/detach, so notify iterates a fixed snapshot
+        self._observers: Tuple[Observer, ...] = ()
+        # Nesting depth of batch() blocks and the data they have collected
+        self._batch_depth = 0
+        self._pending: Optional[Dict[str, Any]] = None
 
     def attach(self, observer: Observer) -> None:
         """
@@ -23,7 +28,7 @@ class Subject(ABC):
         Args:
             observer: The observer to attach
         """
-        self._observers.append(observer)
+        self._observers = (*self._observers, observer)
 
     def detach(self, observer: Observer) -> None:
         """
@@ -31,15 +36,51 @@ class Subject(ABC):
 
         Args:
             observer: The observer to detach
+
+        Raises:
+            ValueError: If the observer is not attached
+        """
+        observers = self._observers
+        index = observers.index(observer)
+        self._observers = observers[:index] + observers[index + 1 :]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
         """
-        self._observers.remove(observer)
+        Coalesce the notifications sent inside the block into one.
+
+        Observers are notified once when the outermost block exits, with
+        the data from every notify() call merged so later values win. If
+        nothing was notified inside the block, observers are not called.
+        If the outermost block exits with an exception, the held-back data
+        is discarded instead of sent.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pending = None
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.notify(**pending)
 
     def notify(self, **kwargs) -> None:
         """
         Notify all observers about an event.
 
+        Inside a batch() block the data is held back until the block exits.
+
         Args:
             **kwargs: Data to pass to observers
         """
+        if self._batch_depth:
+            if self._pending is None:
+                self._pending = {}
+            self._pending.update(kwargs)
+            return
         for observer in self._observers:
             observer.update(self, **kwargs)
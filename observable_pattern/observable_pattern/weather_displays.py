@@ -5,6 +5,29 @@ from .weather_observer import WeatherObserver
 from .weather_station import WeatherStation
 
 
+def _heat_index(t: float, rh: float) -> float:
+    """
+    Evaluate the unrounded heat index polynomial.
+
+    The 16-term polynomial is grouped by powers of t, and each group's
+    coefficient is a cubic in rh; both levels use Horner's method.
+
+    Args:
+        t: Temperature in Fahrenheit
+        rh: Relative humidity (percentage)
+
+    Returns:
+        float: Heat index in Fahrenheit
+    """
+    c0 = 16.923 + rh * (5.37941 + rh * (0.00728898 + rh * 0.0000291583))
+    c1 = 0.185212 + rh * (-0.100254 + rh * (-0.000814971 + rh * 0.000000197483))
+    c2 = 0.00941695 + rh * (0.000345372 + rh * (0.0000102102 + rh * 0.000000000843296))
+    c3 = -0.000038646 + rh * (
+        0.00000142721 + rh * (-0.0000000218429 + rh * -0.0000000000481975)
+    )
+    return c0 + t * (c1 + t * (c2 + t * c3))
+
+
 class CurrentConditionsDisplay(WeatherObserver):
     """Display current weather conditions."""
 
@@ -115,21 +138,4 @@ class HeatIndexDisplay(WeatherObserver):
         Returns:
             float: Heat index in Fahrenheit
         """
-        index = (
-            (16.923 + (0.185212 * t))
-            + (5.37941 * rh)
-            - (0.100254 * t * rh)
-            + (0.00941695 * (t * t))
-            + (0.00728898 * (rh * rh))
-            + (0.000345372 * (t * t * rh))
-            - (0.000814971 * (t * rh * rh))
-            + (0.0000102102 * (t * t * rh * rh))
-            - (0.000038646 * (t * t * t))
-            + (0.0000291583 * (rh * rh * rh))
-            + (0.00000142721 * (t * t * t * rh))
-            + (0.000000197483 * (t * rh * rh * rh))
-            - (0.0000000218429 * (t * t * t * rh * rh))
-            + 0.000000000843296 * (t * t * rh * rh * rh)
-            - (0.0000000000481975 * (t * t * t * rh * rh * rh))
-        )
-        return round(index, 1)
+        return round(_heat_index(t, rh), 1)
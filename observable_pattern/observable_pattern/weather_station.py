@@ -1,5 +1,7 @@
 """Weather station implementation."""
 
+from typing import Sequence, Tuple
+
 from .subject import Subject
 
 
@@ -43,3 +45,22 @@ class WeatherStation(Subject):
         self._humidity = humidity
         self._pressure = pressure
         self.notify(temperature=temperature, humidity=humidity, pressure=pressure)
+
+    def set_measurements_batch(
+        self, samples: Sequence[Tuple[float, float, float]]
+    ) -> None:
+        """
+        Apply a batch of measurements and notify observers once.
+
+        Only the last sample is kept and pushed to observers; the earlier
+        samples in the batch are skipped.
+
+        Args:
+            samples: (temperature, humidity, pressure) tuples, oldest first
+
+        Raises:
+            ValueError: If samples is empty
+        """
+        if not samples:
+            raise ValueError("samples must not be empty")
+        self.set_measurements(*samples[-1])
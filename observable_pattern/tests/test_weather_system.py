@@ -11,9 +11,33 @@ from observable_pattern.weather_displays import (
     StatisticsDisplay,
     ForecastDisplay,
     HeatIndexDisplay,
+    _heat_index,
 )
 
 
+def expanded_heat_index(t, rh):
+    """
+    Reference heat index: the 16-term polynomial written out term by term.
+    """
+    return (
+        (16.923 + (0.185212 * t))
+        + (5.37941 * rh)
+        - (0.100254 * t * rh)
+        + (0.00941695 * (t * t))
+        + (0.00728898 * (rh * rh))
+        + (0.000345372 * (t * t * rh))
+        - (0.000814971 * (t * rh * rh))
+        + (0.0000102102 * (t * t * rh * rh))
+        - (0.000038646 * (t * t * t))
+        + (0.0000291583 * (rh * rh * rh))
+        + (0.00000142721 * (t * t * t * rh))
+        + (0.000000197483 * (t * rh * rh * rh))
+        - (0.0000000218429 * (t * t * t * rh * rh))
+        + 0.000000000843296 * (t * t * rh * rh * rh)
+        - (0.0000000000481975 * (t * t * t * rh * rh * rh))
+    )
+
+
 class TestWeatherStation(unittest.TestCase):
     """
     Test cases for the WeatherStation class.
@@ -80,6 +104,84 @@ class TestWeatherStation(unittest.TestCase):
         # Verify the observer was not called
         mock_observer.update.assert_not_called()
 
+    def test_detach_during_notify(self):
+        """
+        Test that detaching mid-notification does not skip other observers.
+        """
+        first = MagicMock()
+        second = MagicMock()
+        first.update.side_effect = lambda subject, **kwargs: subject.detach(first)
+        self.weather_station.attach(first)
+        self.weather_station.attach(second)
+
+        self.weather_station.set_measurements(75.0, 65.0, 30.5)
+
+        second.update.assert_called_once()
+        with self.assertRaises(ValueError):
+            self.weather_station.detach(first)
+
+    def test_batch_coalesces_notifications(self):
+        """
+        Test that updates inside batch() reach observers once, on exit.
+        """
+        mock_observer = MagicMock()
+        self.weather_station.attach(mock_observer)
+
+        with self.weather_station.batch():
+            self.weather_station.set_measurements(70.0, 60.0, 30.0)
+            with self.weather_station.batch():
+                self.weather_station.set_measurements(75.0, 65.0, 30.5)
+            mock_observer.update.assert_not_called()
+
+        mock_observer.update.assert_called_once_with(
+            self.weather_station, temperature=75.0, humidity=65.0, pressure=30.5
+        )
+
+        # An empty batch notifies nobody
+        mock_observer.reset_mock()
+        with self.weather_station.batch():
+            pass
+        mock_observer.update.assert_not_called()
+
+    def test_batch_discards_notifications_on_error(self):
+        """
+        Test that a batch aborted by an exception notifies nobody.
+        """
+        mock_observer = MagicMock()
+        self.weather_station.attach(mock_observer)
+
+        with self.assertRaises(RuntimeError):
+            with self.weather_station.batch():
+                self.weather_station.set_measurements(70.0, 60.0, 30.0)
+                raise RuntimeError("sensor failure")
+
+        mock_observer.update.assert_not_called()
+
+        # Later updates are dispatched normally again
+        self.weather_station.set_measurements(75.0, 65.0, 30.5)
+        mock_observer.update.assert_called_once_with(
+            self.weather_station, temperature=75.0, humidity=65.0, pressure=30.5
+        )
+
+    def test_set_measurements_batch(self):
+        """
+        Test that a batch keeps the last sample and notifies observers once.
+        """
+        mock_observer = MagicMock()
+        self.weather_station.attach(mock_observer)
+
+        self.weather_station.set_measurements_batch(
+            [(70.0, 60.0, 30.0), (75.0, 65.0, 30.5)]
+        )
+
+        self.assertEqual(self.weather_station.temperature, 75.0)
+        mock_observer.update.assert_called_once_with(
+            self.weather_station, temperature=75.0, humidity=65.0, pressure=30.5
+        )
+
+        with self.assertRaises(ValueError):
+            self.weather_station.set_measurements_batch([])
+
 
 class TestCurrentConditionsDisplay(unittest.TestCase):
     """
@@ -205,6 +307,17 @@ class TestHeatIndexDisplay(unittest.TestCase):
         # This is an approximation, may need to adjust epsilon
         self.assertAlmostEqual(self.display.heat_index, 83.0, places=1)
 
+    def test_heat_index_matches_expanded_polynomial(self):
+        """
+        Test that the Horner form agrees with the term-by-term polynomial.
+        """
+        for t in range(-20, 131, 5):
+            for rh in range(0, 101, 5):
+                with self.subTest(t=t, rh=rh):
+                    self.assertAlmostEqual(
+                        _heat_index(t, rh), expanded_heat_index(t, rh), delta=1e-6
+                    )
+
     @patch("builtins.print")
     def test_display_output(self, mock_print):
         """